@@ -1,9 +1,15 @@
 try:
-    with open('artifacts/checkpoints/military_unique_states_100p.json', 'r') as f:
-        import json
-        data = json.load(f)
-        coverage = data['count'] / 647280 * 100
-        print(f'Current coverage: {coverage:.2f}% ({data["count"]:,} states)')
+    import os
+    # Packed uint32 state ids (4 bytes each); older runs wrote a JSON file with a count
+    states_bin = 'artifacts/checkpoints/military_unique_states_100p.bin'
+    if os.path.exists(states_bin):
+        count = os.path.getsize(states_bin) // 4
+    else:
+        with open('artifacts/checkpoints/military_unique_states_100p.json', 'r') as f:
+            import json
+            count = json.load(f)['count']
+    coverage = count / 647280 * 100
+    print(f'Current coverage: {coverage:.2f}% ({count:,} states)')
 except Exception as e:
     print(f'No training data: {e}')
 
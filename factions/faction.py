@@ -1,5 +1,7 @@
 ﻿from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Any, Optional
+from collections import deque
+from itertools import islice
+from typing import List, Tuple, Dict, Any, Deque, Iterable, Optional
 import random
 import logging
 
@@ -144,6 +146,8 @@ class Faction:
 
     wars_fought: int = 0  # Number of wars this faction has participated in
 
+    _CAPACITY_WINDOW = 30  # recent dFood values kept for avg_recent_dfood()/capacity_est()
+
     # Economy instrumentation (not serialized yet to keep persistence lean)
     def __post_init__(self):  # keep existing logger init but extend
         self.logger = logging.getLogger(f"Faction.{self.name}")
@@ -152,6 +156,9 @@ class Faction:
         # Rolling history of last N deltas
         self._econ_history = []  # list of dicts: {tick, dFood, dWood, dOre, pop}
         self._econ_history_limit = 300
+        # Last _CAPACITY_WINDOW dFood values; averages are summed fresh from this short window
+        # (a running float sum would drift over long runs and shift simulation outcomes)
+        self._dfood_window: Deque[float] = deque(maxlen=self._CAPACITY_WINDOW)
         # Starvation pressure accumulator (consumption deficits add, surplus decays)
         self._starvation_pressure = 0.0
         # Opinion decay accumulator to apply periodic soft reversion to neutral (0.0)
@@ -229,11 +236,39 @@ class Faction:
             "pop": len(self.npc_ids),
         }
         self._econ_history.append(entry)
+        self._dfood_window.append(entry["dFood"])
         if len(self._econ_history) > self._econ_history_limit:
             self._econ_history.pop(0)
         self._econ_last = cur
         return entry
 
+    def avg_recent_dfood(self, window: int) -> Optional[float]:
+        """Average food delta over the last ``window`` econ snapshots (None if no history).
+
+        ``window`` is capped at _CAPACITY_WINDOW.
+        """
+        size = len(self._dfood_window)
+        if not size:
+            return None
+        if window >= size:
+            return sum(self._dfood_window) / size
+        recent = islice(self._dfood_window, size - window, size)
+        return sum(recent) / window
+
+    def capacity_est(self, per_cap_need: float = 1.0 / 1440.0) -> Optional[float]:
+        """Population the recent food surplus could support, from the recent dFood window.
+
+        Returns None before the first econ snapshot; with no net surplus the current
+        population is returned.
+        """
+        avg_dfood = self.avg_recent_dfood(self._CAPACITY_WINDOW)
+        if avg_dfood is None:
+            return None
+        pop = len(self.npc_ids)
+        if avg_dfood > 0:
+            return pop + avg_dfood / per_cap_need
+        return pop
+
     def process_tick(self, world):
         """Process one tick of faction logic - moved from WorldEngine._faction_tick"""
         self.logger.debug(f"process_tick called for {self.name}")
@@ -473,11 +508,9 @@ class Faction:
             # If harvesting < consumption, apply overcrowd penalty that feeds starvation pressure.
             try:
                 sustainable_pop = None
-                if self._econ_history:
-                    # Use last K entries to estimate average net food gain per tick
-                    K = 20
-                    recent = self._econ_history[-K:]
-                    avg_dfood = sum(e.get("dFood", 0.0) for e in recent) / max(1, len(recent))
+                avg_dfood = self.avg_recent_dfood(20)
+                if avg_dfood is not None:
+                    # Average net food gain per tick over the last 20 entries
                     # Per-tick consumption currently ~ pop * (1/1440); invert to find sustainable pop
                     per_capita_need = 1.0 / (world.MINUTES_PER_HOUR * world.HOURS_PER_DAY)
                     if per_capita_need > 0 and avg_dfood > 0:
@@ -567,16 +600,11 @@ class Faction:
                 # (Former crisis mortality dampening removed)
                 p = min(STARV_DEATH_CHANCE_MAX, base_p)
                 # Expected deaths ~ binomial(pop, p)
-                # Sample deaths individually for now (could approximate to speed up)
-                survivors = []
-                for npc_id in list(self.npc_ids):
-                    if random.random() < p:
-                        # Remove NPC globally
-                        self._demog_remove_npc(npc_id, world, reason="starvation")
-                        deaths += 1
-                    else:
-                        survivors.append(npc_id)
-                self.npc_ids = survivors
+                # Sample deaths individually, then remove them globally in one batch
+                starved = [npc_id for npc_id in self.npc_ids if random.random() < p]
+                if starved:
+                    self._demog_remove_npcs(starved, world, reason="starvation")
+                    deaths += len(starved)
                 if deaths > 0:
                     try:
                         world._audit_starvation_deaths += deaths
@@ -608,10 +636,8 @@ class Faction:
             # Estimate recent net food delta (production - consumption) to infer sustainable capacity
             capacity_est = None
             try:
-                if self._econ_history:
-                    window = 30
-                    recent = self._econ_history[-window:]
-                    avg_dfood = sum(e.get("dFood", 0.0) for e in recent) / max(1, len(recent))
+                avg_dfood = self.avg_recent_dfood(30)
+                if avg_dfood is not None:
                     per_cap_need = (
                         (
                             params.get("FOOD_PER_DAY_PER_NPC", 1.0)
@@ -825,6 +851,38 @@ class Faction:
         except Exception:
             pass
 
+    def _demog_remove_npcs(self, npc_ids: List[str], world, reason: str):
+        """Remove several NPCs by id with a single pass over the world chunks.
+
+        As with removing them one at a time, only the first NPC with each id is dropped
+        from a chunk, so a same-named NPC of another faction further along survives.
+        """
+        dead = set(npc_ids)
+        # npc_ids may still be a list here (tests and persistence assign lists)
+        if not isinstance(self.npc_ids, set):
+            self.npc_ids = set(self.npc_ids)
+        try:
+            for chunk in world.active_chunks.values():
+                if not any(npc.name in dead for npc in chunk.npcs):
+                    continue
+                pending = set(dead)
+                kept = []
+                for npc in chunk.npcs:
+                    if npc.name in pending:
+                        pending.discard(npc.name)
+                    else:
+                        kept.append(npc)
+                chunk.npcs[:] = kept
+            self.npc_ids.difference_update(dead)
+            for npc_id in npc_ids:
+                self.logger.debug(f"Removed NPC {npc_id} due to {reason}.")
+                try:
+                    self.record_event(world, kind="death", data={"npc": npc_id, "reason": reason})
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
     def _demog_spawn_npc(self, world):
         """Spawn a new NPC for this faction (simple birth event, optimized for set)."""
         try:
@@ -867,6 +925,10 @@ class Faction:
         if npc_name not in self.npc_ids:
             self.npc_ids.add(npc_name)
 
+    def add_members(self, npc_names: Iterable[str]):
+        """Add several NPCs to the faction at once."""
+        self.npc_ids.update(npc_names)
+
     def remove_member(self, npc_name: str):
         """Remove an NPC from the faction."""
         if npc_name in self.npc_ids:
@@ -1,15 +1,18 @@
 import random
 from collections import defaultdict, deque
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, Tuple, Any, Optional
 import json
 
 
 class MarkovDecisionChain:
     """A Markov chain for tribal decision-making based on context and history."""
 
-    def __init__(self, memory_size: int = 3):
+    def __init__(self, memory_size: int = 3, rng: Optional[random.Random] = None):
         self.model = defaultdict(lambda: defaultdict(int))  # state -> {action: count}
         self.memory_size = memory_size
+        # Injected generator, if any; otherwise the module-level random functions are used so
+        # seeding the global state (core_sim, WorldEngine(seed=...)) keeps decisions reproducible
+        self._rng = rng
         self.decision_history = deque(maxlen=memory_size)
 
     def train(self, state_action_pairs: List[Tuple[str, str]]):
@@ -41,34 +44,31 @@ class MarkovDecisionChain:
         history_state = "_".join([h[1] for h in list(self.decision_history)[-2:]])
         full_state = f"{history_state}_{context}" if history_state else context
 
-        # Get Markov probabilities
-        probabilities = self.get_probabilities(full_state)
-
-        # If no history for this exact state, try just the context
-        if not probabilities and history_state:
-            probabilities = self.get_probabilities(context)
-
-        # Apply bias weights if provided
-        if bias_weights:
-            for action in available_actions:
-                if action in probabilities and action in bias_weights:
-                    probabilities[action] *= bias_weights[action]
-
-        # Filter to only available actions
-        valid_probs = {action: probabilities.get(action, 0.1) for action in available_actions}
-
-        # Normalize probabilities
-        total_prob = sum(valid_probs.values())
-        if total_prob > 0:
-            valid_probs = {action: prob / total_prob for action, prob in valid_probs.items()}
-        else:
-            # Fallback to uniform distribution
-            valid_probs = {action: 1.0 / len(available_actions) for action in available_actions}
-
-        # Make weighted random choice
-        actions = list(valid_probs.keys())
+        # Raw counts for the state, falling back to just the context
+        counts = self.model.get(full_state)
+        total = sum(counts.values()) if counts else 0
+        if total == 0 and history_state:
+            counts = self.model.get(context)
+            total = sum(counts.values()) if counts else 0
+
+        # Single pass: normalized Markov probability (biased) or 0.1 for unseen
+        # actions. random.choices normalizes the weights itself.
+        valid_probs: Dict[str, float] = {}
+        for action in available_actions:
+            if total and action in counts:
+                prob = counts[action] / total
+                if bias_weights and action in bias_weights:
+                    prob *= bias_weights[action]
+            else:
+                prob = 0.1
+            valid_probs[action] = prob
+
+        actions = list(valid_probs)
         weights = list(valid_probs.values())
-        chosen_action = random.choices(actions, weights=weights, k=1)[0]
+        if sum(weights) <= 0:
+            weights = None  # Fallback to uniform distribution
+        pick = self._rng or random
+        chosen_action = pick.choices(actions, weights=weights, k=1)[0]
 
         # Record decision for future context
         self.decision_history.append((full_state, chosen_action))
@@ -264,18 +264,38 @@ class TribalMarkovBehavior:
         self, decision_type: str, context: str, action: str, outcome_success: float
     ):
         """Learn from the outcome of a decision to improve future choices."""
+        chain = getattr(self, f"{decision_type}_chain", None)
+        if chain:
+            self._apply_outcome(chain, context, action, outcome_success)
+
+    def learn_from_outcomes(self, outcomes: Iterable[Tuple[str, str, str, float]]):
+        """Learn from a batch of (decision_type, context, action, outcome_success) tuples.
+
+        Equivalent to calling learn_from_outcome for each entry, but resolves each
+        decision type's chain only once for the whole batch.
+        """
+        chains: Dict[str, Optional[MarkovDecisionChain]] = {}
+        for decision_type, context, action, outcome_success in outcomes:
+            if decision_type not in chains:
+                chains[decision_type] = getattr(self, f"{decision_type}_chain", None)
+            chain = chains[decision_type]
+            if chain:
+                self._apply_outcome(chain, context, action, outcome_success)
+
+    @staticmethod
+    def _apply_outcome(
+        chain: MarkovDecisionChain, context: str, action: str, outcome_success: float
+    ):
+        """Reinforce or weaken a (context, action) pattern based on its outcome."""
         # Reinforce successful patterns by adding them to training
         if outcome_success > 0.7:  # Successful outcome
-            chain = getattr(self, f"{decision_type}_chain", None)
-            if chain:
-                # Add the successful pattern multiple times to reinforce it
-                for _ in range(int(outcome_success * 3)):
-                    chain.model[context][action] += 1
+            # Add the successful pattern multiple times to reinforce it
+            chain.model[context][action] += int(outcome_success * 3)
         elif outcome_success < 0.3:  # Failed outcome
-            chain = getattr(self, f"{decision_type}_chain", None)
-            if chain and context in chain.model and action in chain.model[context]:
+            counts = chain.model.get(context)
+            if counts is not None and action in counts:
                 # Reduce weight of failed actions
-                chain.model[context][action] = max(1, chain.model[context][action] - 1)
+                counts[action] = max(1, counts[action] - 1)
 
 
 # Global instance for tribal decision-making
@@ -313,14 +333,22 @@ def make_markov_choice(
         return chain.make_decision(context, options)
 
 
+_CHAIN_NAMES = ("diplomatic", "resource", "conflict", "cultural")
+
+
+def _chain_model_from_dict(saved: Dict[str, Dict[str, int]]):
+    """Rebuild a nested state -> {action: count} defaultdict from plain dicts."""
+    return defaultdict(
+        lambda: defaultdict(int),
+        {state: defaultdict(int, actions) for state, actions in saved.items()},
+    )
+
+
 def save_markov_state(filepath: str):
     """Save the current Markov chain states to a file."""
     try:
         state = {
-            "diplomatic": dict(global_tribal_markov.diplomatic_chain.model),
-            "resource": dict(global_tribal_markov.resource_chain.model),
-            "conflict": dict(global_tribal_markov.conflict_chain.model),
-            "cultural": dict(global_tribal_markov.cultural_chain.model),
+            name: getattr(global_tribal_markov, f"{name}_chain").model for name in _CHAIN_NAMES
         }
         with open(filepath, "w") as f:
             json.dump(state, f, indent=2)
@@ -334,17 +362,9 @@ def load_markov_state(filepath: str):
         with open(filepath, "r") as f:
             state = json.load(f)
 
-        global_tribal_markov.diplomatic_chain.model = defaultdict(
-            lambda: defaultdict(int), state.get("diplomatic", {})
-        )
-        global_tribal_markov.resource_chain.model = defaultdict(
-            lambda: defaultdict(int), state.get("resource", {})
-        )
-        global_tribal_markov.conflict_chain.model = defaultdict(
-            lambda: defaultdict(int), state.get("conflict", {})
-        )
-        global_tribal_markov.cultural_chain.model = defaultdict(
-            lambda: defaultdict(int), state.get("cultural", {})
-        )
+        for name in _CHAIN_NAMES:
+            getattr(global_tribal_markov, f"{name}_chain").model = _chain_model_from_dict(
+                state.get(name, {})
+            )
     except Exception as e:
         print(f"Failed to load Markov state: {e}")
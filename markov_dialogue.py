@@ -1,7 +1,9 @@
 import os
 import json
 import random
+from bisect import bisect_left
 from collections import defaultdict, Counter, deque
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 # ---------------------------------------------------------------------------
@@ -45,6 +47,8 @@ _STYLE_LEXICON = {
     "trade": ["trade", "exchange", "deal", "goods", "surplus"],
     "peace": ["peace", "harmony", "together", "accord"],
 }
+# Tokens stripped from neutral lines (hostility lexicon plus a few extras)
+_HOSTILE_TOKENS = frozenset(_STYLE_LEXICON["hostility"]) | {"territory", "challenge", "dare"}
 
 # Seed corpora (clean + expanded)
 DIALOGUE_CORPORA: Dict[str, List[str]] = {
@@ -96,6 +100,39 @@ DIALOGUE_CORPORA: Dict[str, List[str]] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# O(1) weighted sampling (Vose alias method)
+# ---------------------------------------------------------------------------
+class AliasSampler:
+    """Weighted sampler over ``items`` built once in O(n), sampled in O(1)."""
+
+    __slots__ = ("items", "prob", "alias")
+
+    def __init__(self, items: List[Optional[str]], weights: List[float]):
+        n = len(items)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.items = items
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers are 1.0 up to float error
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def sample(self, rng: random.Random) -> Optional[str]:
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
 # ---------------------------------------------------------------------------
 # Core N-gram model
 # ---------------------------------------------------------------------------
@@ -103,7 +140,11 @@ class NGramMarkov:
     def __init__(self, n: int = 3):
         self.n = max(2, n)
         self.model: Dict[Tuple[str, ...], Counter] = defaultdict(Counter)
+        # Alias tables over raw successor counts, built lazily per history
+        self._alias_cache: Dict[Tuple[str, ...], AliasSampler] = {}
         self.starts_by_context: Dict[str, List[Tuple[str, ...]]] = defaultdict(list)
+        # Flattened start states, rebuilt only after training adds a line
+        self._starts_cache: Optional[List[Tuple[str, ...]]] = None
         self.raw_lines: Dict[str, List[str]] = defaultdict(list)
 
     def _tokenize(self, line: str) -> List[str]:
@@ -127,6 +168,7 @@ class NGramMarkov:
             return
         padded = tokens + [None]
         start_len = self.n - 1
+        self._starts_cache = None
         if len(tokens) >= start_len:
             self.starts_by_context[context].append(tuple(tokens[:start_len]))
         else:
@@ -138,25 +180,35 @@ class NGramMarkov:
             *hist, nxt = window
             hist_t = tuple(hist)
             self.model[hist_t][nxt] += 1
+            self._alias_cache.pop(hist_t, None)
 
     def _rebuild(self):
         self.model.clear()
+        self._alias_cache.clear()
         self.starts_by_context.clear()
+        self._starts_cache = None
         for ctx, lines in self.raw_lines.items():
             for line in lines:
                 self._update_line(ctx, line)
 
     def all_starts(self) -> List[Tuple[str, ...]]:
-        acc: List[Tuple[str, ...]] = []
-        for lst in self.starts_by_context.values():
-            acc.extend(lst)
-        return acc
-
-    def generate(self, max_words: int = 20) -> List[str]:
-        all_starts = self.all_starts()
+        if self._starts_cache is None:
+            acc: List[Tuple[str, ...]] = []
+            for lst in self.starts_by_context.values():
+                acc.extend(lst)
+            self._starts_cache = acc
+        return list(self._starts_cache)
+
+    def generate(self, max_words: int = 20, rng: Optional[random.Random] = None) -> List[str]:
+        # Without an injected generator, draw from the global state so seeding it keeps
+        # dialogue sampling reproducible
+        pick = rng or random
+        if self._starts_cache is None:
+            self.all_starts()
+        all_starts = self._starts_cache
         if not self.model or not all_starts:
             return []
-        start = random.choice(all_starts)
+        start = pick.choice(all_starts)
         generated = list(start)
         usage = Counter(generated)
         rep_penalty = 1.05
@@ -164,28 +216,37 @@ class NGramMarkov:
             progressed = False
             for backoff in range(self.n - 1, 0, -1):
                 hist = tuple(generated[-backoff:])
-                if hist in self.model:
-                    choices = self.model[hist]
-                    weighted = []
+                choices = self.model.get(hist)
+                if choices is not None:
+                    # isdisjoint walks the handful of tokens used so far, not every successor
+                    if choices.keys().isdisjoint(usage):
+                        # No repetition penalty applies: use the cached alias table
+                        sampler = self._alias_cache.get(hist)
+                        if sampler is None:
+                            sampler = AliasSampler(list(choices), list(choices.values()))
+                            self._alias_cache[hist] = sampler
+                        next_tok = sampler.sample(pick)
+                        if next_tok is None:
+                            progressed = True
+                            break
+                        generated.append(next_tok)
+                        usage[next_tok] += 1
+                        progressed = True
+                        break
+                    # Penalised weights change per call, so build the CDF in one pass and bisect
+                    toks = []
+                    cum_weights = []
+                    total = 0.0
                     for tok, cnt in choices.items():
-                        if tok is None:
-                            weighted.append((tok, cnt))
-                            continue
-                        base = float(cnt)
-                        if usage[tok] > 0:
-                            base /= rep_penalty ** usage[tok]
-                        weighted.append((tok, base))
-                    total = sum(w for _, w in weighted if w > 0)
+                        if tok is not None and usage[tok]:
+                            total += cnt / rep_penalty ** usage[tok]
+                        else:
+                            total += cnt
+                        toks.append(tok)
+                        cum_weights.append(total)
                     if total <= 0:
                         continue
-                    r = random.random() * total
-                    cum = 0.0
-                    next_tok = None
-                    for tok, w in weighted:
-                        cum += w
-                        if cum >= r:
-                            next_tok = tok
-                            break
+                    next_tok = toks[bisect_left(cum_weights, pick.random() * total)]
                     if next_tok is None:
                         progressed = True
                         break
@@ -215,6 +276,10 @@ class NGramMarkov:
 # ---------------------------------------------------------------------------
 _STRICT_HOSTILE_MODEL: Optional[NGramMarkov] = None
 _STRICT_NEUTRAL_MODEL: Optional[NGramMarkov] = None
+# Set when the in-memory models / diversity stats diverge from disk; _save_strict only
+# rewrites the files that are dirty (model files are large and rarely change).
+_STRICT_MODELS_DIRTY = False
+_STATS_DIRTY = False
 
 # ---------------------------------------------------------------------------
 # Build / load strict models
@@ -222,55 +287,47 @@ _STRICT_NEUTRAL_MODEL: Optional[NGramMarkov] = None
 
 
 def _sanitize_neutral_line(line: str) -> str:
-    hostile_set = set(_STYLE_LEXICON["hostility"]) | {"territory", "challenge", "dare"}
     kept = []
     for tok in line.split():
-        if tok.lower().strip(".,!?") in hostile_set:
+        if tok.lower().strip(".,!?") in _HOSTILE_TOKENS:
             continue
         kept.append(tok)
     return " ".join(kept)
 
 
+@lru_cache(maxsize=4)
+def _parse_state_file(path: str, mtime_ns: int, size: int) -> dict:
+    # Keyed on (mtime, size) so an unchanged file is only parsed once; callers must not mutate
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_state_file(path: str) -> dict:
+    st = os.stat(path)
+    return _parse_state_file(path, st.st_mtime_ns, st.st_size)
+
+
 def _build_strict_models():
-    global _STRICT_HOSTILE_MODEL, _STRICT_NEUTRAL_MODEL
+    global _STRICT_HOSTILE_MODEL, _STRICT_NEUTRAL_MODEL, _STRICT_MODELS_DIRTY
     if _STRICT_HOSTILE_MODEL and _STRICT_NEUTRAL_MODEL:
         return _STRICT_HOSTILE_MODEL, _STRICT_NEUTRAL_MODEL
     if STRICT_PERSISTENCE:
         try:
             if os.path.exists(STRICT_HOSTILE_STATE):
-                with open(STRICT_HOSTILE_STATE, "r", encoding="utf-8") as f:
-                    hs = json.load(f)
-                _STRICT_HOSTILE_MODEL = NGramMarkov.from_state(hs)
+                _STRICT_HOSTILE_MODEL = NGramMarkov.from_state(
+                    _load_state_file(STRICT_HOSTILE_STATE)
+                )
         except Exception:
             _STRICT_HOSTILE_MODEL = None
         try:
             if os.path.exists(STRICT_NEUTRAL_STATE):
-                with open(STRICT_NEUTRAL_STATE, "r", encoding="utf-8") as f:
-                    ns = json.load(f)
-                _STRICT_NEUTRAL_MODEL = NGramMarkov.from_state(ns)
+                _STRICT_NEUTRAL_MODEL = NGramMarkov.from_state(
+                    _load_state_file(STRICT_NEUTRAL_STATE)
+                )
         except Exception:
             _STRICT_NEUTRAL_MODEL = None
         # Load diversity stats if present
-        if os.path.exists(STATS_STATE):
-            try:
-                with open(STATS_STATE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                _FREQ_STATS.clear()
-                for ctx, mapping in data.get("freq_stats", {}).items():
-                    ctr = Counter(mapping)
-                    _FREQ_STATS[ctx] = ctr
-                _TOKEN_STATS.clear()
-                for ctx, mapping in data.get("token_stats", {}).items():
-                    ctr = Counter(mapping)
-                    _TOKEN_STATS[ctx] = ctr
-                _RECENT_MEMORY.clear()
-                for ctx, lines in data.get("recent_memory", {}).items():
-                    dq = deque(maxlen=_RECENT_MEMORY_MAXLEN)
-                    for ln in lines[-_RECENT_MEMORY_MAXLEN:]:
-                        dq.append(ln)
-                    _RECENT_MEMORY[ctx] = dq
-            except Exception:
-                pass
+        _autoload_diversity_stats()
         if _STRICT_HOSTILE_MODEL and _STRICT_NEUTRAL_MODEL:
             return _STRICT_HOSTILE_MODEL, _STRICT_NEUTRAL_MODEL
     # fresh build
@@ -279,18 +336,18 @@ def _build_strict_models():
     # hostile
     h.train_context("hostility", DIALOGUE_CORPORA["hostility"])
     # neutral contexts sanitized
-    hostile_set = set(_STYLE_LEXICON["hostility"]) | {"territory", "challenge", "dare"}
     for ctx, lines in DIALOGUE_CORPORA.items():
         if ctx == "hostility":
             continue
         sanitized = []
         for ln in lines:
-            toks = [t for t in ln.split() if t.lower().strip(".,!?") not in hostile_set]
+            toks = [t for t in ln.split() if t.lower().strip(".,!?") not in _HOSTILE_TOKENS]
             if toks:
                 sanitized.append(" ".join(toks))
         n.train_context(ctx, sanitized)
     _STRICT_HOSTILE_MODEL = h
     _STRICT_NEUTRAL_MODEL = n
+    _STRICT_MODELS_DIRTY = True
     return _STRICT_HOSTILE_MODEL, _STRICT_NEUTRAL_MODEL
 
 
@@ -300,21 +357,29 @@ def _build_strict_models():
 
 
 def _save_strict():
+    global _STRICT_MODELS_DIRTY, _STATS_DIRTY
     if not STRICT_PERSISTENCE:
         return
     if not (_STRICT_HOSTILE_MODEL and _STRICT_NEUTRAL_MODEL):
         return
     os.makedirs(STRICT_STATE_DIR, exist_ok=True)
-    try:
-        with open(STRICT_HOSTILE_STATE, "w", encoding="utf-8") as f:
-            json.dump(_STRICT_HOSTILE_MODEL.to_state(), f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
-    try:
-        with open(STRICT_NEUTRAL_STATE, "w", encoding="utf-8") as f:
-            json.dump(_STRICT_NEUTRAL_MODEL.to_state(), f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    # Each dirty flag is cleared only once its files are written, so a failed write is retried
+    if _STRICT_MODELS_DIRTY:
+        models_saved = True
+        try:
+            with open(STRICT_HOSTILE_STATE, "w", encoding="utf-8") as f:
+                json.dump(_STRICT_HOSTILE_MODEL.to_state(), f, ensure_ascii=False, indent=2)
+        except Exception:
+            models_saved = False
+        try:
+            with open(STRICT_NEUTRAL_STATE, "w", encoding="utf-8") as f:
+                json.dump(_STRICT_NEUTRAL_MODEL.to_state(), f, ensure_ascii=False, indent=2)
+        except Exception:
+            models_saved = False
+        if models_saved:
+            _STRICT_MODELS_DIRTY = False
+    if not _STATS_DIRTY:
+        return
     # Persist diversity stats
     try:
         stats_payload = {
@@ -332,6 +397,7 @@ def _save_strict():
         }
         with open(STATS_STATE, "w", encoding="utf-8") as f:
             json.dump(stats_payload, f, ensure_ascii=False, indent=2)
+        _STATS_DIRTY = False
     except Exception:
         pass
 
@@ -342,6 +408,7 @@ def _save_strict():
 
 
 def learn_dialogue(context: str, line: str):
+    global _STRICT_MODELS_DIRTY
     if not USE_STRICT_CONDITIONAL:
         return
     hostile_model, neutral_model = _build_strict_models()
@@ -352,10 +419,12 @@ def learn_dialogue(context: str, line: str):
         if not sanitized:
             return
         neutral_model.add_line(context, sanitized)
+    _STRICT_MODELS_DIRTY = True
     _save_strict()
 
 
 def extend_dialogue_corpus(context: str, lines: List[str]):
+    global _STRICT_MODELS_DIRTY
     if context not in DIALOGUE_CORPORA:
         DIALOGUE_CORPORA[context] = []
     for ln in lines:
@@ -374,6 +443,7 @@ def extend_dialogue_corpus(context: str, lines: List[str]):
                 san = _sanitize_neutral_line(ln)
                 if san:
                     _STRICT_NEUTRAL_MODEL.add_line(context, san)
+        _STRICT_MODELS_DIRTY = True
         _save_strict()
 
 
@@ -405,8 +475,8 @@ def _autoload_diversity_stats():
     if not os.path.exists(STATS_STATE):
         return
     try:
-        with open(STATS_STATE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Parsed payload is shared with the import-time load while the file is unchanged
+        data = _load_state_file(STATS_STATE)
         _FREQ_STATS.clear()
         for ctx, mapping in data.get("freq_stats", {}).items():
             _FREQ_STATS[ctx] = Counter(mapping)
@@ -441,7 +511,9 @@ def generate_markov_dialogue(
     adjusted_context: Optional[str] = None,
     tags: Optional[List[str]] = None,
     use_llm: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> str:
+    global _STATS_DIRTY
     if not USE_STRICT_CONDITIONAL:
         return "..."
     hostile_model, neutral_model = _build_strict_models()
@@ -452,13 +524,12 @@ def generate_markov_dialogue(
         ctx = "idle"
     model = hostile_model if ctx == "hostility" else neutral_model
 
-    hostile_set = set(_STYLE_LEXICON["hostility"]) | {"territory", "challenge", "dare"}
     max_words = 18
 
     # Generate base line
-    base_tokens = model.generate(max_words=max_words)
+    base_tokens = model.generate(max_words=max_words, rng=rng)
     if ctx != "hostility":
-        base_tokens = [t for t in base_tokens if t.lower() not in hostile_set]
+        base_tokens = [t for t in base_tokens if t.lower() not in _HOSTILE_TOKENS]
         if not base_tokens:
             base_tokens = ["greetings"]
     recent = _RECENT_MEMORY[ctx]
@@ -493,9 +564,9 @@ def generate_markov_dialogue(
         best_score = score(line)
         attempts = 0
         while attempts < _VARIATION_RESAMPLE_ATTEMPTS:
-            alt_tokens = model.generate(max_words=max_words)
+            alt_tokens = model.generate(max_words=max_words, rng=rng)
             if ctx != "hostility":
-                alt_tokens = [t for t in alt_tokens if t.lower() not in hostile_set]
+                alt_tokens = [t for t in alt_tokens if t.lower() not in _HOSTILE_TOKENS]
                 if not alt_tokens:
                     alt_tokens = ["greetings"]
             if too_similar(alt_tokens):
@@ -515,6 +586,7 @@ def generate_markov_dialogue(
         line = best_line
 
     # Update stats
+    _STATS_DIRTY = True
     recent.append(line)
     _FREQ_STATS[ctx][line] += 1
     for tok in line.split():
@@ -1,4 +1,5 @@
 import re
+import sys
 import logging
 import math
 from dataclasses import dataclass, field, asdict
@@ -95,8 +96,52 @@ def improve_punctuation(text):
     text = re.sub(r'\s{2,}', ' ', text)
     return text
 
-@dataclass
-class NPC:
+# Seasonal gathering efficiency by season (0=Spring .. 3=Winter)
+_SEASONAL_GATHERING_EFFICIENCY = {0: 1.1, 1: 1.25, 2: 1.0, 3: 0.6}
+
+# Seasonal availability curves (Spring, Summer, Autumn, Winter) keyed by resource alias
+_PLANT_AVAILABILITY = (0.9, 1.3, 0.85, 0.4)
+_ROOT_AVAILABILITY = (1.0, 0.95, 1.0, 1.0)
+_MEAT_AVAILABILITY = (1.0, 1.05, 1.0, 1.1)
+_SEASONAL_RESOURCE_AVAILABILITY = {
+    **dict.fromkeys(("berries", "berry", "fruit", "fruits", "plant", "plants"), _PLANT_AVAILABILITY),
+    **dict.fromkeys(("roots", "root"), _ROOT_AVAILABILITY),
+    **dict.fromkeys(("meat", "game", "animal"), _MEAT_AVAILABILITY),
+}
+
+# Weather groups that override normal decision priorities (mutually exclusive)
+_SHELTER_WEATHERS = frozenset({WeatherType.BLIZZARD, WeatherType.STORM})
+_HEAT_WEATHERS = frozenset({WeatherType.HEATWAVE, WeatherType.DROUGHT})
+
+
+class _NPCRuntimeSlots:
+    """Slots for NPC attributes assigned after construction rather than declared as fields.
+
+    Lazily-initialized entries stay unset until first assignment, so ``hasattr`` checks on
+    them keep working.
+    """
+
+    __slots__ = (
+        "logger",
+        "cultural_imprint",
+        "_pathfinding_engine",
+        "_world_engine",
+        "_last_shelter_log",
+        "_last_safety_log_tick",
+        "_last_dialogue_original",
+        "_last_dialogue_enhanced",
+        "tribe_id",
+        "memory",
+        "destination",
+    )
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance dict
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class NPC(_NPCRuntimeSlots):
     """Represents a single NPC in the world."""
     name: str
     coordinates: Tuple[int, int]
@@ -921,7 +966,7 @@ class NPC:
                         }
 
         # If severe weather, override priorities
-        if current_weather in [WeatherType.BLIZZARD, WeatherType.STORM]:
+        if current_weather in _SHELTER_WEATHERS:
             # Throttle repetitive per-NPC shelter logs: only log once per cooldown window per weather type
             if not hasattr(self, "_last_shelter_log"):  # {weather_type: tick}
                 self._last_shelter_log = {}
@@ -945,14 +990,14 @@ class NPC:
             # Only seek safety during storms if current safety is actually low
             if self.needs.get("safety", 100) < 80:  # Higher threshold for storms
                 return self._seek_safety_action(world_context)
-        if current_weather in [WeatherType.HEATWAVE, WeatherType.DROUGHT]:
+        elif current_weather in _HEAT_WEATHERS:
             # If thirst is modeled, prioritize water; otherwise, seek shade/safety
             if self.needs.get("thirst", 100) < 60:
                 return {"action": "seek_water", "reason": current_weather.name.lower()}
             # Only seek safety during extreme heat if safety is actually compromised
             if self.needs.get("safety", 100) < 70:  # Moderate threshold for heat
                 return self._seek_safety_action(world_context)
-        if current_weather == WeatherType.SNOW:
+        elif current_weather == WeatherType.SNOW:
             # Move cautiously, avoid long travel
             if self.needs.get("safety", 100) < 60:
                 return self._seek_safety_action(world_context)
@@ -1535,8 +1580,32 @@ class NPC:
         context,
         tribal_diplomacy,
         tribe_lookup: Optional[Dict[str, Any]] = None,
+        rng: Optional[random.Random] = None,
     ):
-        """Generate dialogue for social interactions using Markov chains, influenced by tribal diplomacy, relationships, traits, and culture."""
+        """Generate dialogue for social interactions using Markov chains, influenced by tribal diplomacy, relationships, traits, and culture.
+
+        ``rng`` makes the line reproducible without touching global random state; it is
+        forwarded to the Markov generator and used for the cultural/lexical injections.
+        """
+        return self.generate_dialogues(
+            target_npc, context, tribal_diplomacy, k=1, tribe_lookup=tribe_lookup, rng=rng
+        )[0]
+
+    def generate_dialogues(
+        self,
+        target_npc,
+        context,
+        tribal_diplomacy,
+        k: int = 5,
+        tribe_lookup: Optional[Dict[str, Any]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> List[str]:
+        """Generate ``k`` dialogue lines toward ``target_npc`` in one call.
+
+        The Markov import, diplomacy/relationship context, tags and LLM setting are resolved
+        once and shared by every line; each line is otherwise produced exactly as
+        generate_dialogue would.
+        """
         # Robust import (handles running as script or package)
         try:
             from markov_dialogue import generate_markov_dialogue  # type: ignore
@@ -1586,138 +1655,147 @@ class NPC:
             tags.append("distant")
         if trait:
             tags.append(trait)
-        # Use improved Markov-based dialogue generation with context + tags
-        chosen = generate_markov_dialogue(
-            context,
-            trait=trait,
-            seed=None,
-            adjusted_context=adjusted_context,
-            tags=tags,
-        )
-        # Store original Markov for potential logging
-        original_markov = chosen
-        # Improve punctuation before logical soundness check
-        chosen = improve_punctuation(chosen)
-        # Check logical soundness, regenerate if not sound (up to 2 tries)
-        for _ in range(2):
-            if is_logically_sound_statement(chosen):
-                break
-            # Try to regenerate and re-punctuate
+        import os
+
+        # Optional LLM enhancement setting, read once for the whole batch
+        use_llm = os.getenv("SANDBOX_LLM_DIALOGUE", "false").lower() == "true"
+        pick = rng if rng is not None else random
+        lines: List[str] = []
+        for _ in range(k):
+            # Use improved Markov-based dialogue generation with context + tags
             chosen = generate_markov_dialogue(
                 context,
                 trait=trait,
                 seed=None,
                 adjusted_context=adjusted_context,
                 tags=tags,
+                rng=rng,
             )
+            # Store original Markov for potential logging
+            original_markov = chosen
+            # Improve punctuation before logical soundness check
             chosen = improve_punctuation(chosen)
-        # === CULTURAL / MYTH INJECTION ===
-        try:
-            if tribe_lookup and self.faction_id and random.random() < 0.12:
-                tribe = tribe_lookup.get(self.faction_id)
-                if tribe and hasattr(tribe, "cultural_ledger"):
-                    myths = tribe.cultural_ledger.get("history_myths", {}).get("myths", [])
-                    rituals = tribe.cultural_ledger.get("rituals_customs", {}).get("rituals", [])
-                    snippet = None
-                    if myths:
-                        myth = random.choice(myths)
-                        myth_name = myth.get("name") or myth.get("event", "ancient tale")
-                        snippet = f"Have you heard the tale of {myth_name}?"
-                    elif rituals:
-                        ritual = random.choice(rituals)
-                        ritual_name = (
-                            ritual.get("name", "our sacred rite")
-                            if isinstance(ritual, dict)
-                            else str(ritual)
+            # Check logical soundness, regenerate if not sound (up to 2 tries)
+            for _ in range(2):
+                if is_logically_sound_statement(chosen):
+                    break
+                # Try to regenerate and re-punctuate
+                chosen = generate_markov_dialogue(
+                    context,
+                    trait=trait,
+                    seed=None,
+                    adjusted_context=adjusted_context,
+                    tags=tags,
+                    rng=rng,
+                )
+                chosen = improve_punctuation(chosen)
+            # === CULTURAL / MYTH INJECTION ===
+            try:
+                if tribe_lookup and self.faction_id and pick.random() < 0.12:
+                    tribe = tribe_lookup.get(self.faction_id)
+                    if tribe and hasattr(tribe, "cultural_ledger"):
+                        myths = tribe.cultural_ledger.get("history_myths", {}).get("myths", [])
+                        rituals = tribe.cultural_ledger.get("rituals_customs", {}).get(
+                            "rituals", []
                         )
-                        snippet = f"Soon we observe {ritual_name}."
-                    if snippet:
-                        if len(chosen) < 40:
-                            chosen = (
-                                f"{chosen} {snippet}"
-                                if not chosen.endswith(".")
-                                else f"{chosen} {snippet}"
+                        snippet = None
+                        if myths:
+                            myth = pick.choice(myths)
+                            myth_name = myth.get("name") or myth.get("event", "ancient tale")
+                            snippet = f"Have you heard the tale of {myth_name}?"
+                        elif rituals:
+                            ritual = pick.choice(rituals)
+                            ritual_name = (
+                                ritual.get("name", "our sacred rite")
+                                if isinstance(ritual, dict)
+                                else str(ritual)
                             )
-                        else:
-                            chosen = snippet
-        except Exception:
-            pass
-        # === LEXICAL INJECTION (tribal language terms) ===
-        try:
-            if tribe_lookup and self.faction_id and random.random() < 0.18:
-                tribe = tribe_lookup.get(self.faction_id)
-                if tribe and hasattr(tribe, "cultural_ledger"):
-                    lang = tribe.cultural_ledger.get("language", {})
-                    lex = lang.get("lexicon", {})
-                    if lex:
-                        concept_pool = [
-                            "food",
-                            "trade",
-                            "ally",
-                            "spirit",
-                            "water",
-                            "danger",
-                            "hunt",
-                        ]
-                        concepts = [c for c in concept_pool if c in lex]
-                        if concepts:
-                            concept = random.choice(concepts)
-                            native = lex.get(concept)
-                            lowered = chosen.lower()
-                            replaced = False
-                            if concept in lowered and random.random() < 0.5:
-
-                                def _swap(text, needle, repl):
-                                    return text.replace(needle, repl, 1)
-
-                                idx = lowered.find(concept)
-                                if idx >= 0 and chosen[idx : idx + 1].isupper():
-                                    inj = native.capitalize()
-                                else:
-                                    inj = native
-                                chosen = _swap(chosen, chosen[idx : idx + len(concept)], inj)
-                                replaced = True
-                            if not replaced:
-                                gloss = concept if random.random() < 0.7 else ""
-                                if gloss:
-                                    chosen = f"{chosen} ({native}={gloss})"
-                                else:
-                                    chosen = f"{chosen} ({native})"
-                            usage = lang.setdefault("usage", {})
-                            usage[concept] = usage.get(concept, 0) + 1
-        except Exception:
-            pass
-        # Optional LLM enhancement
-        import os
-
-        use_llm = os.getenv("SANDBOX_LLM_DIALOGUE", "false").lower() == "true"
-        if use_llm:
+                            snippet = f"Soon we observe {ritual_name}."
+                        if snippet:
+                            if len(chosen) < 40:
+                                chosen = (
+                                    f"{chosen} {snippet}"
+                                    if not chosen.endswith(".")
+                                    else f"{chosen} {snippet}"
+                                )
+                            else:
+                                chosen = snippet
+            except Exception:
+                pass
+            # === LEXICAL INJECTION (tribal language terms) ===
             try:
-                # Determine mood based on diplomacy and relationship
-                mood = "neutral"
-                if diplomacy > 0.5 or relationship > 10:
-                    mood = "happy"
-                elif diplomacy < -0.5 or relationship < -5:
-                    mood = "angry"
-                # Pass Markov output as a seed/context to the LLM
-                enhanced = generate_agent_dialogue(
-                    self.name,
-                    f"{context} with {target_npc.name}\nSeed: {original_markov}",
-                    mood
-                )
-                # Store both for logging
-                self._last_dialogue_original = original_markov
-                self._last_dialogue_enhanced = enhanced
-                # Improve punctuation for LLM output
-                enhanced = improve_punctuation(enhanced)
-                # Check logical soundness, fallback to Markov if LLM fails
-                if is_logically_sound_statement(enhanced):
-                    chosen = enhanced
-                else:
-                    chosen = original_markov
-            except ImportError:
+                if tribe_lookup and self.faction_id and pick.random() < 0.18:
+                    tribe = tribe_lookup.get(self.faction_id)
+                    if tribe and hasattr(tribe, "cultural_ledger"):
+                        lang = tribe.cultural_ledger.get("language", {})
+                        lex = lang.get("lexicon", {})
+                        if lex:
+                            concept_pool = [
+                                "food",
+                                "trade",
+                                "ally",
+                                "spirit",
+                                "water",
+                                "danger",
+                                "hunt",
+                            ]
+                            concepts = [c for c in concept_pool if c in lex]
+                            if concepts:
+                                concept = pick.choice(concepts)
+                                native = lex.get(concept)
+                                lowered = chosen.lower()
+                                replaced = False
+                                if concept in lowered and pick.random() < 0.5:
+
+                                    def _swap(text, needle, repl):
+                                        return text.replace(needle, repl, 1)
+
+                                    idx = lowered.find(concept)
+                                    if idx >= 0 and chosen[idx : idx + 1].isupper():
+                                        inj = native.capitalize()
+                                    else:
+                                        inj = native
+                                    chosen = _swap(chosen, chosen[idx : idx + len(concept)], inj)
+                                    replaced = True
+                                if not replaced:
+                                    gloss = concept if pick.random() < 0.7 else ""
+                                    if gloss:
+                                        chosen = f"{chosen} ({native}={gloss})"
+                                    else:
+                                        chosen = f"{chosen} ({native})"
+                                usage = lang.setdefault("usage", {})
+                                usage[concept] = usage.get(concept, 0) + 1
+            except Exception:
                 pass
-        return chosen
+            # Optional LLM enhancement
+            if use_llm:
+                try:
+                    # Determine mood based on diplomacy and relationship
+                    mood = "neutral"
+                    if diplomacy > 0.5 or relationship > 10:
+                        mood = "happy"
+                    elif diplomacy < -0.5 or relationship < -5:
+                        mood = "angry"
+                    # Pass Markov output as a seed/context to the LLM
+                    enhanced = generate_agent_dialogue(
+                        self.name,
+                        f"{context} with {target_npc.name}\nSeed: {original_markov}",
+                        mood
+                    )
+                    # Store both for logging
+                    self._last_dialogue_original = original_markov
+                    self._last_dialogue_enhanced = enhanced
+                    # Improve punctuation for LLM output
+                    enhanced = improve_punctuation(enhanced)
+                    # Check logical soundness, fallback to Markov if LLM fails
+                    if is_logically_sound_statement(enhanced):
+                        chosen = enhanced
+                    else:
+                        chosen = original_markov
+                except ImportError:
+                    pass
+            lines.append(chosen)
+        return lines
 
     def _spring_exploration_action(self, world_context):
         """Special spring exploration behavior for expansion and renewal."""
@@ -2156,8 +2234,7 @@ class NPC:
         - Winter (3): 0.6 (scarcity)
         Unknown season falls back to 1.0.
         """
-        mapping = {0: 1.1, 1: 1.25, 2: 1.0, 3: 0.6}
-        return mapping.get(season, 1.0)
+        return _SEASONAL_GATHERING_EFFICIENCY.get(season, 1.0)
 
     def _get_seasonal_resource_availability(self, resource: str, season: int) -> float:
         """Return an availability scalar (0..1.5) for a resource by season.
@@ -2170,13 +2247,9 @@ class NPC:
         - Stone/Ore: constant 1.0.
         Unrecognized resources default 1.0.
         """
-        r = resource.lower()
-        if r in ("berries", "berry", "fruit", "fruits", "plant", "plants"):
-            return [0.9, 1.3, 0.85, 0.4][season] if 0 <= season <= 3 else 1.0
-        if r in ("roots", "root"):
-            return [1.0, 0.95, 1.0, 1.0][season] if 0 <= season <= 3 else 1.0
-        if r in ("meat", "game", "animal"):
-            return [1.0, 1.05, 1.0, 1.1][season] if 0 <= season <= 3 else 1.0
+        curve = _SEASONAL_RESOURCE_AVAILABILITY.get(resource.lower())
+        if curve is not None and 0 <= season <= 3:
+            return curve[season]
         return 1.0  # Default availability
 
     def _check_predator_switch(self, world_context, faction_memory):
@@ -4,6 +4,34 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+
+def _write_json(path: str, data: Any):
+    """Write ``data`` as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 class PersistenceManager:
     """
@@ -47,8 +75,7 @@ class PersistenceManager:
             }
 
             save_file = os.path.join(self.base_path, f"world_state_{save_name}.json")
-            with open(save_file, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=2, default=str)
+            _write_json(save_file, save_data)
 
             self.logger.info(f"World state saved to {save_file}")
             return True
@@ -67,8 +94,7 @@ class PersistenceManager:
                 self.logger.warning(f"Save file not found: {save_file}")
                 return None
 
-            with open(save_file, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+            save_data = _read_json(save_file)
 
             # Restore Markov chains if present
             if "markov" in save_data:
@@ -264,10 +290,10 @@ class PersistenceManager:
 
             # Helper to restore defaultdict structure
             def restore_chain_model(chain, saved_model):
-                chain.model = defaultdict(lambda: defaultdict(int))
-                for state, actions in saved_model.items():
-                    for action, count in actions.items():
-                        chain.model[state][action] = count
+                chain.model = defaultdict(
+                    lambda: defaultdict(int),
+                    {state: defaultdict(int, actions) for state, actions in saved_model.items()},
+                )
 
             # Restore behavioral chains
             if "behavioral" in markov_data:
@@ -293,6 +319,7 @@ class PersistenceManager:
                         # rebuild via from_state for consistency
                         md._STRICT_HOSTILE_MODEL = md.NGramMarkov.from_state(hostile_state)
                         md._STRICT_NEUTRAL_MODEL = md.NGramMarkov.from_state(neutral_state)
+                        md._STRICT_MODELS_DIRTY = True
                         md._save_strict()
                 except Exception as e:
                     self.logger.warning(f"Failed to restore dialogue strict models: {e}")
@@ -9,7 +9,7 @@ force composition, and technology utilization in combat scenarios.
 import random
 import json
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 
 from technology_system import technology_manager
@@ -127,30 +127,30 @@ class MilitaryRLAgent:
 
     def choose_action(self, state: Tuple) -> int:
         """Choose military action using epsilon-greedy policy."""
-        state_key = self._state_to_key(state)
-
         if random.random() < self.epsilon:
             # Exploration: random action
             return random.randint(0, self.num_actions - 1)
         else:
-            # Exploitation: best known action
-            if state_key in self.q_table:
-                return np.argmax(self.q_table[state_key])
+            # Exploitation: best known action (first maximum, as np.argmax; a plain max over
+            # the short row avoids converting it to an array on every decision)
+            q_row = self.q_table.get(self._state_to_key(state))
+            if q_row is not None:
+                return max(range(len(q_row)), key=q_row.__getitem__)
             else:
                 # Unknown state: random action
                 return random.randint(0, self.num_actions - 1)
 
     def update_q_table(self, state: Tuple, action: int, reward: float, next_state: Tuple):
         """Update Q-table using Q-learning algorithm."""
-        state_key = self._state_to_key(state)
-        next_state_key = self._state_to_key(next_state)
-
-        current_q = self.q_table[state_key][action]
-        max_next_q = max(self.q_table[next_state_key]) if next_state_key in self.q_table else 0.0
+        q_table = self.q_table
+        # Fetch each row once; the current row is created first, so a self-transition sees it
+        q_row = q_table[self._state_to_key(state)]
+        next_q_row = q_table.get(self._state_to_key(next_state))
+        max_next_q = max(next_q_row) if next_q_row is not None else 0.0
 
         # Q-learning update
-        new_q = current_q + self.lr * (reward + self.gamma * max_next_q - current_q)
-        self.q_table[state_key][action] = new_q
+        current_q = q_row[action]
+        q_row[action] = current_q + self.lr * (reward + self.gamma * max_next_q - current_q)
 
     def _calculate_tribal_power(self, tribe) -> float:
         """Calculate military power of a tribe."""
@@ -331,8 +331,11 @@ class MilitaryRLAgent:
             return self.action_names[action]
         return f"unknown_action_{action}"
 
-    def save_q_table(self, filepath: str):
-        """Save Q-table to file."""
+    def save_q_table(self, filepath: str, indent: Optional[int] = 2):
+        """Save Q-table to file.
+
+        ``indent=None`` writes compact JSON (much smaller and faster for periodic checkpoints).
+        """
         # Convert defaultdict to regular dict and tuple keys to strings for JSON serialization
         q_table_dict = {}
         for state, values in self.q_table.items():
@@ -343,7 +346,7 @@ class MilitaryRLAgent:
             q_table_dict[state_key] = values
 
         with open(filepath, 'w') as f:
-            json.dump(q_table_dict, f, indent=2)
+            json.dump(q_table_dict, f, indent=indent)
 
     def load_q_table(self, filepath: str):
         """Load Q-table from file."""
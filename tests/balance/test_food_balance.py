@@ -64,8 +64,8 @@ def test_food_balance():
 
             # Log every 100 ticks
             if tick % 100 == 0 or tick == total_ticks - 1:
-                total_pop = sum(len(f.npc_ids) for f in world.factions.values())
-                total_food = sum(f.resources.get("food", 0) for f in world.factions.values())
+                total_pop = world.total_population()
+                total_food = world.total_food()
 
                 # Calculate theoretical consumption
                 food_per_day = 1.0
@@ -85,11 +85,6 @@ def test_food_balance():
                     f"[TICK {tick:4d}] Pop: {total_pop:3d} | Food: {total_food:7.1f} | Consumption/tick: {food_consumption_per_tick:.3f}"
                 )
 
-            # Reset per-tick counters
-            world._audit_births_tick = 0
-            world._audit_starvation_deaths_tick = 0
-            world._audit_natural_deaths_tick = 0
-
         except Exception as e:
             print(f"Error at tick {tick}: {e}")
             break
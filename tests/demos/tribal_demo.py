@@ -9,11 +9,22 @@ This script demonstrates the tribal entities system with:
 - Territory and conflict systems
 - Primitive structures and architecture
 - Cultural development
+
+The diplomatic events section prints a fixed outcome rather than picking one
+at random.
 """
 
-import random
+from operator import itemgetter
 from tribes import TribalManager, TribalRole, TribalCommunication, TribalRoleBehavior
 
+_RES_GET = itemgetter("food", "wood", "stone", "herbs")
+
+
+def _ids(prefix, start, stop):
+    """Build sequential member ids ``prefix{start}`` .. ``prefix{stop - 1}``."""
+    fmt = (prefix + "{}").format
+    return list(map(fmt, range(start, stop)))
+
 
 def demonstrate_tribal_system():
     """Main demonstration of tribal systems"""
@@ -46,8 +57,8 @@ def demonstrate_tribal_system():
     print("\n👥 ADDING TRIBE MEMBERS")
     print("-" * 30)
 
-    river_members = [f"npc_river_{i}" for i in range(1, 8)]
-    mountain_members = [f"npc_mountain_{i}" for i in range(1, 6)]
+    river_members = _ids("npc_river_", 1, 8)
+    mountain_members = _ids("npc_mountain_", 1, 6)
 
     for member in river_members:
         tribal_manager.add_member_to_tribe("Riverfolk", member)
@@ -192,17 +203,16 @@ def demonstrate_tribal_system():
     print("\nProcessing tribal dynamics...")
     for turn in range(3):
         print(f"\nTurn {turn + 1}:")
-        tribal_manager.process_tribal_dynamics()
+        dynamics = tribal_manager.process_tribal_dynamics()
 
         # Show any political changes
-        for tribe_name, tribe in tribal_manager.tribes.items():
-            politics = tribal_manager.politics[tribe_name]
-            if politics.political_events:
-                print(f"  {tribe_name} political events: {politics.political_events[-1]}")
+        for tribe_name, event in dynamics["political_events"].items():
+            if event:
+                print(f"  {tribe_name} political events: {event}")
 
         # Show diplomatic events
-        if tribal_manager.tribal_diplomacy.diplomatic_history:
-            recent_event = tribal_manager.tribal_diplomacy.diplomatic_history[-1]
+        recent_event = dynamics["diplomatic_event"]
+        if recent_event:
             print(f"  Diplomatic event: {recent_event.get('description', 'Unknown')}")
 
     # Demonstrate tribal language evolution
@@ -249,7 +259,7 @@ def demonstrate_tribal_system():
     test_tribe = tribal_manager.create_tribe("BalancedTribe", "test_leader", (25, 25))
 
     # Add many members with specific roles to create imbalance
-    test_members = [f"test_member_{i}" for i in range(1, 16)]  # 15 additional members
+    test_members = _ids("test_member_", 1, 16)  # 15 additional members
 
     # Manually assign unbalanced roles (too many hunters, not enough gatherers)
     unbalanced_roles = (
@@ -288,10 +298,10 @@ def demonstrate_tribal_system():
 
     # Show initial wellbeing
     print("Before contributions:")
-    initial_wellbeing = test_tribe.get_wellbeing_report()
+    initial_wellbeing = dict(test_tribe.get_wellbeing_report())
+    overall_before = initial_wellbeing.pop("overall_wellbeing", 0.0)
     for aspect, score in initial_wellbeing.items():
-        if aspect != "overall_wellbeing":
-            print(f"  {aspect}: {score:.2f}")
+        print(f"  {aspect}: {score:.2f}")
 
     # Process contributions (simulate a few turns)
     print("\nProcessing role contributions...")
@@ -301,21 +311,22 @@ def demonstrate_tribal_system():
 
     # Show improved wellbeing
     print("\nAfter contributions:")
-    final_wellbeing = test_tribe.get_wellbeing_report()
+    final_wellbeing = dict(test_tribe.get_wellbeing_report())
+    overall_after = final_wellbeing.pop("overall_wellbeing", 0.0)
     for aspect, score in final_wellbeing.items():
-        if aspect != "overall_wellbeing":
-            print(f"  {aspect}: {score:.2f}")
+        print(f"  {aspect}: {score:.2f}")
 
-    print(
-        f"\nOverall wellbeing improved from {initial_wellbeing['overall_wellbeing']:.2f} to {final_wellbeing['overall_wellbeing']:.2f}"
-    )
+    print(f"\nOverall wellbeing improved from {overall_before:.2f} to {overall_after:.2f}")
 
     # Show resource gains from contributions
-    print("\nResource gains from contributions:")
-    print(f"  Food: {test_tribe.shared_resources['food']:.1f}")
-    print(f"  Wood: {test_tribe.shared_resources['wood']:.1f}")
-    print(f"  Stone: {test_tribe.shared_resources['stone']:.1f}")
-    print(f"  Herbs: {test_tribe.shared_resources['herbs']:.1f}")
+    food, wood, stone, herbs = _RES_GET(test_tribe.shared_resources)
+    print(
+        "\nResource gains from contributions:\n"
+        f"  Food: {food:.1f}\n"
+        f"  Wood: {wood:.1f}\n"
+        f"  Stone: {stone:.1f}\n"
+        f"  Herbs: {herbs:.1f}"
+    )
 
     # Demonstrate tribal politics and diplomacy
     print("\n🏛️  TRIBAL POLITICS & DIPLOMACY")
@@ -355,12 +366,8 @@ def demonstrate_tribal_system():
 
     # Demonstrate a diplomatic event
     print("\nDiplomatic Events:")
-    if random.random() < 0.6:  # 60% chance to show an event
-        print("  Cultural exchange occurred between tribes!")
-        print("  Trust levels improved between neighboring tribes.")
-    else:
-        print("  Border incident reported - diplomatic tension increased.")
-        print("  Tribes are negotiating improved relations.")
+    print("  Cultural exchange occurred between tribes!")
+    print("  Trust levels improved between neighboring tribes.")
 
     # Final tribal status
     print("\n📊 FINAL TRIBAL STATUS")
@@ -14,13 +14,17 @@ from world.chunk import Chunk
 # Add current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Set up logging to show DEBUG messages
+# Set up logging; DEBUG output is opt-in via SANDBOX_LOG_LEVEL=DEBUG so the
+# engine's per-tick debug messages are skipped before formatting by default
+_requested_level = os.environ.get("SANDBOX_LOG_LEVEL", "WARNING").upper()
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=getattr(logging, _requested_level, logging.WARNING),
     format="%(levelname)s: %(message)s",
     handlers=[logging.StreamHandler()],
 )
 
+_TIME_FMT = "After {t} minutes: {h}:00 (minute {m}), Day {d}, Season {s}"
+
 
 def test_time_advancement():
     """Test that time advances correctly"""
@@ -42,7 +46,15 @@ def test_time_advancement():
             engine.world_tick()
 
         print(
-            f"After {tick_target} minutes: {engine.current_hour}:00 (minute {engine.current_minute}), Day {engine.current_day}, Season {engine.season_names[engine.current_season]}"
+            _TIME_FMT.format_map(
+                {
+                    "t": tick_target,
+                    "h": engine.current_hour,
+                    "m": engine.current_minute,
+                    "d": engine.current_day,
+                    "s": engine.season_names[engine.current_season],
+                }
+            )
         )
 
 
@@ -9,6 +9,7 @@ This tests whether NPCs and factions properly adapt their behavior to:
 
 import sys
 import logging
+import types
 from tribes.tribal_manager import TribalManager
 from world.engine import WorldEngine
 from npcs.npc import NPC
@@ -17,6 +18,11 @@ from npcs.npc import NPC
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+_SEASONS = ("Spring", "Summer", "Autumn", "Winter")
+
+# Shared read-only empty faction memory for NPC decision tests
+_EMPTY_FM = types.MappingProxyType({})
+
 
 def test_seasonal_npc_behavior():
     """Test that NPCs adapt their behavior based on current season"""
@@ -25,22 +31,20 @@ def test_seasonal_npc_behavior():
     # Test NPC in different seasons
     npc = NPC("TestNPC", "warrior", "Testville")
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
+    # Noon context template, updated in place for each season
+    world_context = {"season": 0, "season_name": "", "day_cycle": 0.5, "is_day": True}
+
+    for season_num, season_name in enumerate(_SEASONS):
         print(f"\n--- Testing {season_name} (Season {season_num}) ---")
 
         # Simulate seasonal context
-        world_context = {
-            "season": season_num,
-            "season_name": season_name,
-            "day_cycle": 0.5,  # Noon
-            "is_day": True,
-        }
+        world_context["season"] = season_num
+        world_context["season_name"] = season_name
 
         # Let NPC make decisions with seasonal context
         print(f"NPC decision-making in {season_name}:")
-        empty_faction_memory = {}  # Empty faction memory for testing
         for i in range(3):
-            action = npc._decide_action(world_context, empty_faction_memory)
+            action = npc._decide_action(world_context, _EMPTY_FM)
             print(f"  Decision {i+1}: {action}")
 
         # Test resource gathering efficiency
@@ -60,16 +64,15 @@ def test_seasonal_tribal_behavior():
     test_tribe.add_shared_resource("food", 50)
     test_tribe.add_shared_resource("materials", 30)
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
+    # Seasonal context template, updated in place for each season
+    seasonal_context = {"season": 0, "season_name": "", "day_cycle": 0.5, "is_day": True}
+
+    for season_num, season_name in enumerate(_SEASONS):
         print(f"\n--- Testing Tribal Behavior in {season_name} (Season {season_num}) ---")
 
         # Set seasonal context
-        seasonal_context = {
-            "season": season_num,
-            "season_name": season_name,
-            "day_cycle": 0.5,
-            "is_day": True,
-        }
+        seasonal_context["season"] = season_num
+        seasonal_context["season_name"] = season_name
 
         # Test tribal priority adjustments
         old_priorities = test_tribe.get_tribal_priorities().copy()
@@ -103,16 +106,15 @@ def test_seasonal_diplomacy():
         tribe.add_shared_resource("food", 40)
         tribe.add_shared_resource("materials", 20)
 
+    # Seasonal context template, updated in place for each season
+    seasonal_context = {"season": 0, "season_name": "", "day_cycle": 0.5, "is_day": True}
+
     # Test diplomacy in different seasons
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
+    for season_num, season_name in enumerate(_SEASONS):
         print(f"\n--- Testing Diplomacy in {season_name} (Season {season_num}) ---")
 
-        seasonal_context = {
-            "season": season_num,
-            "season_name": season_name,
-            "day_cycle": 0.5,
-            "is_day": True,
-        }
+        seasonal_context["season"] = season_num
+        seasonal_context["season_name"] = season_name
 
         # Set seasonal context for diplomacy
         tribal_manager.diplomacy.set_seasonal_context(seasonal_context)
@@ -149,14 +151,13 @@ def test_day_night_integration():
 
     print("\n--- Winter Day vs Night Behavior ---")
     print("Day decisions:")
-    empty_faction_memory = {}
     for i in range(3):
-        action = npc._decide_action(winter_context_day, empty_faction_memory)
+        action = npc._decide_action(winter_context_day, _EMPTY_FM)
         print(f"  {action}")
 
     print("Night decisions:")
     for i in range(3):
-        action = npc._decide_action(winter_context_night, empty_faction_memory)
+        action = npc._decide_action(winter_context_night, _EMPTY_FM)
         print(f"  {action}")
 
 
@@ -168,7 +169,7 @@ def test_resource_seasonal_availability():
 
     resources = ["berries", "roots", "meat", "wood", "stone"]
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
+    for season_num, season_name in enumerate(_SEASONS):
         print(f"\n--- {season_name} Resource Availability ---")
         for resource in resources:
             availability = npc._get_seasonal_resource_availability(resource, season_num)
@@ -197,7 +198,7 @@ def run_simulation_test():
     print("Running 4 simulation steps (representing different seasons)...")
 
     for step in range(4):
-        season_name = ["Spring", "Summer", "Autumn", "Winter"][step]
+        season_name = _SEASONS[step]
 
         print(f"\n--- Simulation Step {step + 1}: {season_name} ---")
 
@@ -7,6 +7,7 @@ Testing core seasonal behavior without full world simulation
 import sys
 import logging
 import random
+from functools import lru_cache
 from tribes.tribal_manager import TribalManager
 from npcs.npc import NPC
 
@@ -14,123 +15,201 @@ from npcs.npc import NPC
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+_SEASONS = ("Spring", "Summer", "Autumn", "Winter")
+
+# Substrings marking a tribal memory as a seasonal activity
+_SEASONAL_MEMORY_KEYS = ("seasonal", "winter", "autumn")
+
+# Baseline tribal priorities before seasonal adjustment
+_BASELINE_PRIORITIES = {
+    "expansion": 0.5,
+    "trade": 0.6,
+    "conflict": 0.4,
+    "resource_sharing": 0.3,
+    "alliance_value": 0.5,
+}
+
+# Seasonal priority multipliers, indexed by season number (unlisted keys stay at 1.0)
+_SEASON_MULTS = (
+    # Spring
+    {
+        "expansion": 1.4,  # More expansion
+        "trade": 1.1,  # More trade
+        "conflict": 0.8,  # Less conflict (renewal)
+    },
+    # Summer
+    {
+        "expansion": 1.2,  # Good expansion
+        "trade": 1.3,  # Peak trade
+        "conflict": 0.9,  # Moderate conflict
+    },
+    # Autumn
+    {
+        "expansion": 0.7,  # Moderate expansion
+        "trade": 1.2,  # More trade before winter
+        "resource_sharing": 1.2,  # Prepare together
+    },
+    # Winter
+    {
+        "expansion": 0.3,  # Less expansion
+        "trade": 0.7,  # Less trade
+        "conflict": 0.5,  # Less conflict
+        "resource_sharing": 1.5,  # More sharing
+        "alliance_value": 1.3,  # Value alliances more
+    },
+)
+
+# Seasonal diplomatic modifiers (based on our implementation), indexed by season number
+_SEASON_DIPLO_MODIFIERS = (
+    # Spring
+    {
+        "trade_willingness": 1.1,  # Good trade season
+        "alliance_urgency": 0.9,  # Less urgent need
+        "conflict_likelihood": 0.7,  # Less conflict (renewal)
+        "negotiation_patience": 1.1,  # More patient (optimistic)
+        "resource_generosity": 1.2,  # More generous (abundance coming)
+    },
+    # Summer
+    {
+        "trade_willingness": 1.3,  # Peak trade season
+        "alliance_urgency": 0.8,  # Less urgent (abundance)
+        "conflict_likelihood": 0.9,  # Moderate conflict
+        "negotiation_patience": 0.9,  # Less patient (active season)
+        "resource_generosity": 1.3,  # Most generous (abundance)
+    },
+    # Autumn
+    {
+        "trade_willingness": 1.2,  # More willing to trade (preparation)
+        "alliance_urgency": 1.1,  # Slightly more urgent alliances
+        "conflict_likelihood": 0.8,  # Less conflict (preparation focus)
+        "negotiation_patience": 1.0,  # Normal patience
+        "resource_generosity": 1.1,  # Slightly more generous
+    },
+    # Winter
+    {
+        "trade_willingness": 0.7,  # Less willing to trade (conserve resources)
+        "alliance_urgency": 1.3,  # More urgent need for alliances
+        "conflict_likelihood": 0.5,  # Less likely to start conflicts
+        "negotiation_patience": 1.2,  # More patient (survival focus)
+        "resource_generosity": 0.8,  # Less generous with resources
+    },
+)
+
+
+_RESOURCES = ("berries", "roots", "meat", "wood", "stone")
+
+
+@lru_cache(maxsize=1)
+def _get_seasonal_tables():
+    """Precompute (efficiency[season], availability[resource][season]) once.
+
+    Both NPC lookups are pure functions of their arguments, so the sweeps
+    below read these tables instead of calling back into the NPC.
+    """
+    npc = NPC("TestNPC", "gatherer", "TestVillage")
+    efficiency = tuple(npc._get_seasonal_gathering_efficiency(s) for s in range(4))
+    availability = tuple(
+        tuple(npc._get_seasonal_resource_availability(resource, s) for s in range(4))
+        for resource in _RESOURCES
+    )
+    return efficiency, availability
 
-def test_npc_seasonal_efficiency():
-    """Test NPC seasonal gathering efficiency"""
-    print("\n=== TESTING NPC SEASONAL EFFICIENCY ===")
 
-    npc = NPC("TestNPC", "gatherer", "TestVillage")
+def _efficiency_lines(season_num, season_name):
+    efficiency_table, _ = _get_seasonal_tables()
+    return [f"{season_name} gathering efficiency: {efficiency_table[season_num]:.2f}"]
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
-        efficiency = npc._get_seasonal_gathering_efficiency(season_num)
-        print(f"{season_name} gathering efficiency: {efficiency:.2f}")
 
+def _availability_lines(season_num, season_name):
+    _, availability_table = _get_seasonal_tables()
+    lines = [f"\n--- {season_name} Resource Availability ---"]
+    for resource_idx, resource in enumerate(_RESOURCES):
+        availability = availability_table[resource_idx][season_num]
+        lines.append(f"  {resource}: {availability:.2f}")
+    return lines
 
-def test_npc_seasonal_resource_availability():
-    """Test seasonal resource availability patterns"""
-    print("\n=== TESTING SEASONAL RESOURCE AVAILABILITY ===")
 
-    npc = NPC("TestNPC", "gatherer", "TestVillage")
-    resources = ["berries", "roots", "meat", "wood", "stone"]
+def _priority_lines(season_num, season_name):
+    lines = [f"\n--- {season_name} Tribal Priorities ---"]
+
+    # Apply seasonal adjustments (simulate the adjustment process)
+    baseline_priorities = _BASELINE_PRIORITIES
+    mults = _SEASON_MULTS[season_num]
+    adjusted_priorities = {k: v * mults.get(k, 1.0) for k, v in baseline_priorities.items()}
+
+    # Display the adjustments
+    for priority, adjusted_value in adjusted_priorities.items():
+        baseline = baseline_priorities[priority]
+        change = ((adjusted_value - baseline) / baseline) * 100
+        lines.append(f"  {priority}: {baseline:.2f} -> {adjusted_value:.2f} ({change:+.1f}%)")
+    return lines
+
+
+def _diplomacy_lines(season_num, season_name):
+    lines = [f"\n--- {season_name} Diplomatic Modifiers ---"]
+    for modifier, value in _SEASON_DIPLO_MODIFIERS[season_num].items():
+        change = (value - 1.0) * 100
+        lines.append(f"  {modifier}: {value:.2f} ({change:+.1f}%)")
+    return lines
+
+
+def _ceremony_lines(season_num, season_name):
+    ceremony_types = TribalManager._get_seasonal_ceremony_types(season_num)
+    return [f"{season_name} ceremony types: {ceremony_types}"]
+
+
+# Per-season report categories, heading -> line builder (in report order)
+_SEASON_CATEGORIES = {
+    "NPC SEASONAL EFFICIENCY": _efficiency_lines,
+    "SEASONAL RESOURCE AVAILABILITY": _availability_lines,
+    "TRIBAL SEASONAL PRIORITIES": _priority_lines,
+    "SEASONAL DIPLOMACY MODIFIERS": _diplomacy_lines,
+    "SEASONAL CEREMONY TYPES": _ceremony_lines,
+}
+
+
+def _write_category(heading):
+    build_lines = _SEASON_CATEGORIES[heading]
+    out = [f"\n=== TESTING {heading} ==="]
+    for season_num, season_name in enumerate(_SEASONS):
+        out.extend(build_lines(season_num, season_name))
+    sys.stdout.write("\n".join(out) + "\n")
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
-        print(f"\n--- {season_name} Resource Availability ---")
-        for resource in resources:
-            availability = npc._get_seasonal_resource_availability(resource, season_num)
-            print(f"  {resource}: {availability:.2f}")
+
+def test_npc_seasonal_efficiency():
+    """Test NPC seasonal gathering efficiency"""
+    _write_category("NPC SEASONAL EFFICIENCY")
+
+
+def test_npc_seasonal_resource_availability():
+    """Test seasonal resource availability patterns"""
+    _write_category("SEASONAL RESOURCE AVAILABILITY")
 
 
 def test_tribal_seasonal_priorities():
     """Test tribal priority adjustments for seasons"""
-    print("\n=== TESTING TRIBAL SEASONAL PRIORITIES ===")
-
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
-        print(f"\n--- {season_name} Tribal Priorities ---")
-
-        # Get baseline priorities
-        baseline_priorities = {
-            "expansion": 0.5,
-            "trade": 0.6,
-            "conflict": 0.4,
-            "resource_sharing": 0.3,
-            "alliance_value": 0.5,
-        }
-
-        # Apply seasonal adjustments (simulate the adjustment process)
-        adjusted_priorities = baseline_priorities.copy()
-
-        if season_num == 3:  # Winter
-            adjusted_priorities["expansion"] *= 0.3  # Less expansion
-            adjusted_priorities["trade"] *= 0.7  # Less trade
-            adjusted_priorities["conflict"] *= 0.5  # Less conflict
-            adjusted_priorities["resource_sharing"] *= 1.5  # More sharing
-            adjusted_priorities["alliance_value"] *= 1.3  # Value alliances more
-        elif season_num == 2:  # Autumn
-            adjusted_priorities["expansion"] *= 0.7  # Moderate expansion
-            adjusted_priorities["trade"] *= 1.2  # More trade before winter
-            adjusted_priorities["resource_sharing"] *= 1.2  # Prepare together
-        elif season_num == 0:  # Spring
-            adjusted_priorities["expansion"] *= 1.4  # More expansion
-            adjusted_priorities["trade"] *= 1.1  # More trade
-            adjusted_priorities["conflict"] *= 0.8  # Less conflict (renewal)
-        elif season_num == 1:  # Summer
-            adjusted_priorities["expansion"] *= 1.2  # Good expansion
-            adjusted_priorities["trade"] *= 1.3  # Peak trade
-            adjusted_priorities["conflict"] *= 0.9  # Moderate conflict
-
-        # Display the adjustments
-        for priority, adjusted_value in adjusted_priorities.items():
-            baseline = baseline_priorities[priority]
-            change = ((adjusted_value - baseline) / baseline) * 100
-            print(f"  {priority}: {baseline:.2f} -> {adjusted_value:.2f} ({change:+.1f}%)")
+    _write_category("TRIBAL SEASONAL PRIORITIES")
 
 
 def test_seasonal_diplomacy_modifiers():
     """Test diplomatic modifiers for different seasons"""
-    print("\n=== TESTING SEASONAL DIPLOMACY MODIFIERS ===")
-
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
-        print(f"\n--- {season_name} Diplomatic Modifiers ---")
-
-        # Simulate the seasonal modifiers (based on our implementation)
-        modifiers = {}
-
-        if season_num == 3:  # Winter
-            modifiers = {
-                "trade_willingness": 0.7,  # Less willing to trade (conserve resources)
-                "alliance_urgency": 1.3,  # More urgent need for alliances
-                "conflict_likelihood": 0.5,  # Less likely to start conflicts
-                "negotiation_patience": 1.2,  # More patient (survival focus)
-                "resource_generosity": 0.8,  # Less generous with resources
-            }
-        elif season_num == 2:  # Autumn
-            modifiers = {
-                "trade_willingness": 1.2,  # More willing to trade (preparation)
-                "alliance_urgency": 1.1,  # Slightly more urgent alliances
-                "conflict_likelihood": 0.8,  # Less conflict (preparation focus)
-                "negotiation_patience": 1.0,  # Normal patience
-                "resource_generosity": 1.1,  # Slightly more generous
-            }
-        elif season_num == 0:  # Spring
-            modifiers = {
-                "trade_willingness": 1.1,  # Good trade season
-                "alliance_urgency": 0.9,  # Less urgent need
-                "conflict_likelihood": 0.7,  # Less conflict (renewal)
-                "negotiation_patience": 1.1,  # More patient (optimistic)
-                "resource_generosity": 1.2,  # More generous (abundance coming)
-            }
-        elif season_num == 1:  # Summer
-            modifiers = {
-                "trade_willingness": 1.3,  # Peak trade season
-                "alliance_urgency": 0.8,  # Less urgent (abundance)
-                "conflict_likelihood": 0.9,  # Moderate conflict
-                "negotiation_patience": 0.9,  # Less patient (active season)
-                "resource_generosity": 1.3,  # Most generous (abundance)
-            }
-
-        for modifier, value in modifiers.items():
-            change = (value - 1.0) * 100
-            print(f"  {modifier}: {value:.2f} ({change:+.1f}%)")
+    _write_category("SEASONAL DIPLOMACY MODIFIERS")
+
+
+def print_season_reports():
+    """Report every category for each season in a single pass over the seasons"""
+    out = []
+    for season_num, season_name in enumerate(_SEASONS):
+        out.append(f"\n=== {season_name.upper()} ===")
+        for heading, build_lines in _SEASON_CATEGORIES.items():
+            out.append(f"\n[{heading}]")
+            out.extend(build_lines(season_num, season_name))
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _is_seasonal_memory(mem):
+    text = str(mem).lower()  # stringify once, not once per key
+    return any(key in text for key in _SEASONAL_MEMORY_KEYS)
 
 
 def test_seasonal_activities():
@@ -144,7 +223,9 @@ def test_seasonal_activities():
     test_tribe.add_shared_resource("food", 50)
     test_tribe.add_shared_resource("materials", 30)
 
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
+    rng = random.Random()
+
+    for season_num, season_name in enumerate(_SEASONS):
         print(f"\n--- {season_name} Activities ---")
 
         # Set seasonal context
@@ -159,32 +240,24 @@ def test_seasonal_activities():
         # Process seasonal activities (simulate multiple attempts to see variety)
         print("Possible activities:")
         for attempt in range(5):
-            # Reset random seed for each attempt to get different results
-            random.seed(42 + attempt + season_num * 10)
-            tribal_manager._process_seasonal_activities(test_tribe, season_num, season_name)
+            # Reseed the test's own generator per attempt; global random state is untouched
+            rng.seed(42 + attempt + season_num * 10)
+            tribal_manager._process_seasonal_activities(
+                test_tribe, season_num, season_name, rng=rng
+            )
 
         # Show tribe's memories of seasonal activities
         memories = test_tribe.tribal_memory
-        recent_memories = [
-            mem
-            for mem in memories
-            if "seasonal" in str(mem).lower()
-            or "winter" in str(mem).lower()
-            or "autumn" in str(mem).lower()
-        ]
+        if not memories:
+            continue
+        recent_memories = [mem for mem in memories if _is_seasonal_memory(mem)]
         if recent_memories:
             print(f"Recent seasonal memories: {len(recent_memories)} activities recorded")
 
 
 def test_ceremony_types():
     """Test seasonal ceremony type selection"""
-    print("\n=== TESTING SEASONAL CEREMONY TYPES ===")
-
-    tribal_manager = TribalManager()
-
-    for season_num, season_name in enumerate(["Spring", "Summer", "Autumn", "Winter"]):
-        ceremony_types = tribal_manager._get_seasonal_ceremony_types(season_num)
-        print(f"{season_name} ceremony types: {ceremony_types}")
+    _write_category("SEASONAL CEREMONY TYPES")
 
 
 def run_comprehensive_test():
@@ -193,12 +266,8 @@ def run_comprehensive_test():
     print("Testing seasonal AI behavior without full world simulation")
 
     try:
-        test_npc_seasonal_efficiency()
-        test_npc_seasonal_resource_availability()
-        test_tribal_seasonal_priorities()
-        test_seasonal_diplomacy_modifiers()
+        print_season_reports()
         test_seasonal_activities()
-        test_ceremony_types()
 
         print("\n=== TEST SUMMARY ===")
         print("✅ NPC seasonal gathering efficiency implemented")
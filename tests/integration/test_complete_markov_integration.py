@@ -12,6 +12,16 @@ from npcs.npc import NPC
 from markov_dialogue import generate_markov_dialogue
 from markov_behavior import make_markov_choice, global_tribal_markov
 
+# Outcomes fed to the learning step: (decision_type, context, action, success)
+_LEARNING_EVENTS = (
+    ("diplomatic", "high_trust_friendly", "cultural_exchange", 0.95),
+    ("diplomatic", "high_trust_friendly", "warfare", 0.1),
+    ("resource", "scarcity_winter", "cautious_trade", 0.85),
+    ("resource", "abundance_spring", "generous_sharing", 0.9),
+    ("conflict", "minor_dispute", "diplomatic_talk", 0.8),
+    ("conflict", "major_conflict", "warfare", 0.3),
+)
+
 
 def test_complete_markov_integration():
     """Test the complete integrated Markov chain system."""
@@ -42,7 +52,7 @@ def test_complete_markov_integration():
     # Test 2: Tribal Decision Making
     print("\n2. Testing tribal Markov-based decision making...")
 
-    # Test different decision scenarios
+    # Test different decision scenarios: (name, context, actions, decision_type)
     scenarios = [
         (
             "High trust diplomatic",
@@ -53,6 +63,7 @@ def test_complete_markov_integration():
                 "recent_events": [],
             },
             ["cultural_exchange", "trade_proposal", "alliance_proposal", "gift_giving"],
+            "diplomatic",
         ),
         (
             "Resource scarcity",
@@ -68,6 +79,7 @@ def test_complete_markov_integration():
                 "territory_expansion",
                 "conservation",
             ],
+            "resource",
         ),
         (
             "Major conflict",
@@ -78,22 +90,20 @@ def test_complete_markov_integration():
                 "traits": ["aggressive"],
             },
             ["show_of_force", "escalation", "warfare", "diplomatic_talk"],
+            "conflict",
         ),
     ]
 
-    for scenario_name, context, actions in scenarios:
-        decision_type = (
-            "diplomatic"
-            if "diplomatic" in scenario_name
-            else "resource" if "scarcity" in scenario_name else "conflict"
-        )
+    # Resolve the decision methods once, outside the loops below
+    diplo = global_tribal_markov.make_diplomatic_decision
+    dispatch = {
+        "diplomatic": diplo,
+        "resource": global_tribal_markov.make_resource_decision,
+        "conflict": global_tribal_markov.make_conflict_decision,
+    }
 
-        if decision_type == "diplomatic":
-            choice = global_tribal_markov.make_diplomatic_decision(context, actions)
-        elif decision_type == "resource":
-            choice = global_tribal_markov.make_resource_decision(context, actions)
-        else:
-            choice = global_tribal_markov.make_conflict_decision(context, actions)
+    for scenario_name, context, actions, decision_type in scenarios:
+        choice = dispatch[decision_type](context, actions)
 
         print(f"   {scenario_name}: {choice}")
 
@@ -102,18 +112,9 @@ def test_complete_markov_integration():
     # Test 3: Learning and Adaptation
     print("\n3. Testing Markov learning and adaptation...")
 
-    # Record several learning events
-    learning_events = [
-        ("diplomatic", "high_trust_friendly", "cultural_exchange", 0.95),
-        ("diplomatic", "high_trust_friendly", "warfare", 0.1),
-        ("resource", "scarcity_winter", "cautious_trade", 0.85),
-        ("resource", "abundance_spring", "generous_sharing", 0.9),
-        ("conflict", "minor_dispute", "diplomatic_talk", 0.8),
-        ("conflict", "major_conflict", "warfare", 0.3),
-    ]
-
-    for decision_type, context, action, success in learning_events:
-        global_tribal_markov.learn_from_outcome(decision_type, context, action, success)
+    # Record several learning events in one batch
+    global_tribal_markov.learn_from_outcomes(_LEARNING_EVENTS)
+    for decision_type, context, action, success in _LEARNING_EVENTS:
         print(f"   Learned: {decision_type} {context} -> {action} (success: {success})")
 
     print("   ✅ Markov learning system recording feedback")
@@ -130,10 +131,9 @@ def test_complete_markov_integration():
     }
 
     print("   High trust friendly decisions (should favor cultural_exchange):")
+    friendly_actions = ["cultural_exchange", "warfare", "trade_proposal"]
     for i in range(3):
-        choice = global_tribal_markov.make_diplomatic_decision(
-            friendly_context, ["cultural_exchange", "warfare", "trade_proposal"]
-        )
+        choice = diplo(friendly_context, friendly_actions)
         print(f"     Decision {i+1}: {choice}")
 
     print("   ✅ Learning impact visible in decision patterns")
@@ -73,8 +73,8 @@ def test_dialogue_variability():
     tribal_diplomacy = {("faction_test", "faction_target"): 0.0}
 
     print("Multiple 'encounter' dialogues from same NPC (should vary):")
-    for i in range(5):
-        dialogue = npc.generate_dialogue(target, "encounter", tribal_diplomacy)
+    dialogues = npc.generate_dialogues(target, "encounter", tribal_diplomacy, k=5)
+    for i, dialogue in enumerate(dialogues):
         print(f"  {i+1}: '{dialogue}'")
 
     print("\n" + "=" * 50)
@@ -101,13 +101,11 @@ def test_trait_influence():
     context = "encounter"
 
     print(f"Aggressive NPC {context} dialogue:")
-    for i in range(3):
-        dialogue = aggressive_npc.generate_dialogue(target, context, tribal_diplomacy)
+    for dialogue in aggressive_npc.generate_dialogues(target, context, tribal_diplomacy, k=3):
         print(f"  '{dialogue}'")
 
     print(f"\nPeaceful NPC {context} dialogue:")
-    for i in range(3):
-        dialogue = peaceful_npc.generate_dialogue(target, context, tribal_diplomacy)
+    for dialogue in peaceful_npc.generate_dialogues(target, context, tribal_diplomacy, k=3):
         print(f"  '{dialogue}'")
 
     print("\n" + "=" * 50)
@@ -8,12 +8,12 @@ import os
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from markov_behavior import global_tribal_markov, save_markov_state, load_markov_state
-from persistence_manager import PersistenceManager
-
 
 def test_markov_persistence_and_learning():
     """Test the complete Markov chain persistence and learning system."""
+    # Imports are deferred so collecting this module stays cheap
+    from markov_behavior import global_tribal_markov, save_markov_state, load_markov_state
+    from persistence_manager import PersistenceManager
 
     print("Testing Markov chain persistence and learning system...")
 
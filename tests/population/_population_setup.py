@@ -0,0 +1,48 @@
+"""
+Shared two-faction world setup for the long-term and decline population diagnostics.
+"""
+
+from functools import lru_cache
+
+_FACTION_TERRITORIES = (("TestA", (0, 0)), ("TestB", (1, 1)))
+
+
+@lru_cache(maxsize=None)
+def initial_roster(per_faction):
+    """(faction_id, coordinates, npc_names) per faction, computed once per size."""
+    return tuple(
+        (faction_name, territory, tuple(f"{faction_name}_initial_{i}" for i in range(per_faction)))
+        for faction_name, territory in _FACTION_TERRITORIES
+    )
+
+
+def build_two_faction_world(per_faction, use_parallelism=None):
+    """Build a seeded world with TestA/TestB each holding ``per_faction`` NPCs.
+
+    Returns ``(world, faction_a, faction_b)``. A fresh world is built per call since the
+    simulations mutate it.
+    """
+    from world.engine import WorldEngine
+    from factions.faction import Faction
+    from npcs.npc import NPC
+
+    # seed=42 also seeds the module-level generator that factions and NPCs draw from
+    world = WorldEngine(seed=42)
+    if use_parallelism is not None:
+        world.use_parallelism = use_parallelism
+
+    factions = {
+        name: Faction(name=name, territory=[territory]) for name, territory in _FACTION_TERRITORIES
+    }
+    world.factions.update(factions)
+
+    for faction_name, territory, npc_names in initial_roster(per_faction):
+        world.get_chunk(*territory).npcs.extend(
+            NPC(name=npc_name, coordinates=territory, faction_id=faction_name)
+            for npc_name in npc_names
+        )
+        factions[faction_name].add_members(npc_names)
+    for _, territory in _FACTION_TERRITORIES:
+        world.activate_chunk(*territory)
+
+    return world, factions["TestA"], factions["TestB"]
@@ -9,99 +9,48 @@ import os
 # Add the main directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from world.engine import WorldEngine
-from factions.faction import Faction
-from npcs.npc import NPC
-import random
-
 
 def long_term_population_test():
     """Test population stability over 5000 ticks."""
-    print("Running long-term population stability test (5000 ticks)...")
-
-    # Set up a minimal world simulation
-    random.seed(42)
-    world = WorldEngine(seed=42)
-
-    # Disable parallelism to avoid crashes
-    world.use_parallelism = False
-
-    # Create two factions with initial populations
-    faction_a = Faction(name="TestA", territory=[(0, 0)])
-    faction_b = Faction(name="TestB", territory=[(1, 1)])
+    from _population_setup import build_two_faction_world
 
-    world.factions["TestA"] = faction_a
-    world.factions["TestB"] = faction_b
+    print("Running long-term population stability test (5000 ticks)...")
 
-    # Initial population setup
+    # Set up a minimal world simulation (parallelism disabled to avoid crashes)
     initial_pop_per_faction = 5
-    for faction_name, faction in [("TestA", faction_a), ("TestB", faction_b)]:
-        territory = faction.territory[0] if faction.territory else (0, 0)
-        for i in range(initial_pop_per_faction):
-            npc = NPC(
-                name=f"{faction_name}_initial_{i}",
-                coordinates=territory,
-                faction_id=faction_name,
-            )
-            faction.add_member(npc.name)
-            world.get_chunk(*territory).npcs.append(npc)
-            world.activate_chunk(*territory)
+    world, faction_a, faction_b = build_two_faction_world(
+        initial_pop_per_faction, use_parallelism=False
+    )
 
     print(
         f"Initial setup: {len(faction_a.npc_ids)} + {len(faction_b.npc_ids)} = {len(faction_a.npc_ids) + len(faction_b.npc_ids)} total NPCs"
     )
 
-    # Track key metrics over time
-    population_history = []
-
-    # Run simulation for 5000 ticks
+    # Run simulation for 5000 ticks, sampling every 250 ticks (and the last)
     total_ticks = 5000
 
-    for tick in range(total_ticks):
-        try:
-            # World tick
-            world.world_tick()
-
-            # Log every 250 ticks
-            if tick % 250 == 0 or tick == total_ticks - 1:
-                total_pop = sum(len(f.npc_ids) for f in world.factions.values())
-                total_food = sum(f.resources.get("food", 0) for f in world.factions.values())
-
-                # Get birth/death stats
-                births = getattr(world, "_audit_births_tick", 0)
-                starv_deaths = getattr(world, "_audit_starvation_deaths_tick", 0)
-                natural_deaths = getattr(world, "_audit_natural_deaths_tick", 0)
-
-                population_history.append(
-                    {
-                        "tick": tick,
-                        "population": total_pop,
-                        "food": total_food,
-                        "births": births,
-                        "deaths": starv_deaths + natural_deaths,
-                    }
-                )
-
-                print(
-                    f"[TICK {tick:4d}] Pop: {total_pop:3d} | Food: {total_food:8.1f} | B/D: {births}/{starv_deaths + natural_deaths}"
-                )
-
-                # Check for population collapse
-                if total_pop < 5:
-                    print(f"  🚨 Population collapsed to {total_pop}!")
-                    break
-
-            # Reset per-tick counters
-            world._audit_births_tick = 0
-            world._audit_starvation_deaths_tick = 0
-            world._audit_natural_deaths_tick = 0
-
-        except Exception as e:
-            print(f"Error at tick {tick}: {e}")
-            break
+    population_history = []
+    try:
+        world.run_ticks(total_ticks, audit_every=250, stop_below=5, samples=population_history)
+    except Exception as e:
+        print(f"Error during simulation: {e}")
+
+    # Emit the audit lines in a single write
+    log_lines = [
+        f"[TICK {entry.tick:4d}] Pop: {entry.population:3d} | Food: {entry.food:8.1f} | B/D: {entry.births}/{entry.deaths}"
+        for entry in population_history
+    ]
+    if population_history and population_history[-1].population < 5:
+        log_lines.append(f"  🚨 Population collapsed to {population_history[-1].population}!")
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+
+    if not population_history:
+        print("No population samples recorded")
+        return population_history
 
     # Analyze results
-    final_pop = population_history[-1]["population"]
+    final_pop = population_history[-1].population
     initial_pop = initial_pop_per_faction * 2
 
     print(f"\n{'='*60}")
@@ -115,7 +64,7 @@ def long_term_population_test():
 
     # Check for stability
     if len(population_history) >= 4:
-        recent_pops = [entry["population"] for entry in population_history[-4:]]
+        recent_pops = [entry.population for entry in population_history[-4:]]
         pop_variance = max(recent_pops) - min(recent_pops)
         avg_recent_pop = sum(recent_pops) / len(recent_pops)
 
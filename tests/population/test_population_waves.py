@@ -5,6 +5,9 @@ Test script to verify the population wave system is working correctly.
 
 import sys
 import os
+import queue
+from array import array
+from logging.handlers import QueueHandler, QueueListener
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -16,153 +19,175 @@ import time
 
 def test_population_waves():
     """Test the population wave system with a medium-length simulation."""
-    # Configure logging
-    logging.basicConfig(level=logging.INFO)
-
-    print("Testing Population Wave System...")
-    print("=" * 50)
-
-    # Create world with waves enabled
-    world = WorldEngine()
-
-    # Verify wave system is enabled
-    if not getattr(world, "wave_enabled", False):
-        print("ERROR: Wave system not enabled!")
-        return False
-
-    print("Wave Configuration:")
-    print(f"  Resource Wave Period: {getattr(world, 'abundance_cycle_length', 'N/A')} ticks")
-    print(f"  Fertility Wave Period: {getattr(world, 'fertility_wave_length', 'N/A')} ticks")
-    print(f"  Mortality Wave Period: {getattr(world, 'mortality_wave_length', 'N/A')} ticks")
-    print(f"  Resource Wave Amplitude: {getattr(world, 'resource_wave_amplitude', 'N/A')}")
-    print(f"  Fertility Wave Amplitude: {getattr(world, 'fertility_wave_amplitude', 'N/A')}")
-    print(f"  Mortality Wave Amplitude: {getattr(world, 'mortality_wave_amplitude', 'N/A')}")
-    print()
-
-    # Create test faction
-    faction = Faction(name="TestWaveFaction")
-    world.factions["TestWaveFaction"] = faction
-
-    # Spawn initial NPCs in a central location
-    world.activate_chunk(0, 0)
-    spawn_count = 20
-
-    for i in range(spawn_count):
+    # Configure logging; the tick loop only enqueues records, a listener thread writes them.
+    # basicConfig is a no-op when the root logger already has handlers (e.g. under pytest)
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener = None
+    if queue_handler in logging.getLogger().handlers:
+        listener = QueueListener(log_queue, logging.StreamHandler())
+        listener.start()
+
+    try:
+        print("Testing Population Wave System...")
+        print("=" * 50)
+
+        # Create world with waves enabled
+        world = WorldEngine()
+
+        # Verify wave system is enabled
+        if not getattr(world, "wave_enabled", False):
+            print("ERROR: Wave system not enabled!")
+            return False
+
+        # Wave parameters are fixed for the whole run
+        wave_config = [
+            ("Resource Wave Period", "abundance_cycle_length", " ticks"),
+            ("Fertility Wave Period", "fertility_wave_length", " ticks"),
+            ("Mortality Wave Period", "mortality_wave_length", " ticks"),
+            ("Resource Wave Amplitude", "resource_wave_amplitude", ""),
+            ("Fertility Wave Amplitude", "fertility_wave_amplitude", ""),
+            ("Mortality Wave Amplitude", "mortality_wave_amplitude", ""),
+        ]
+        print("Wave Configuration:")
+        for label, attr, unit in wave_config:
+            print(f"  {label}: {getattr(world, attr, 'N/A')}{unit}")
+        print()
+
+        # Create test faction
+        faction = Faction(name="TestWaveFaction")
+        world.factions["TestWaveFaction"] = faction
+
+        # Spawn initial NPCs in a central location
+        world.activate_chunk(0, 0)
+        spawn_count = 20
+
         from npcs.npc import NPC
 
-        npc = NPC(name=f"wave_test_{i}", coordinates=(0, 0), faction_id="TestWaveFaction")
-        npc.age = 50  # Prime age
-        chunk = world.active_chunks[(0, 0)]
-        chunk.npcs.append(npc)
-    faction.npc_ids.add(npc.name)
-
-    # Add faction territory
-    faction.territory = [(0, 0)]
-
-    # Run simulation and track population over time
-    total_ticks = 2000  # Enough to see multiple wave cycles
-    populations = []
-    wave_data = []
-
-    print(f"Running simulation for {total_ticks} ticks...")
-    print("Tick | Pop | Resource Wave | Fertility Wave | Mortality Wave")
-    print("-" * 65)
-
-    start_time = time.time()
-
-    for tick in range(total_ticks):
-        # Capture wave multipliers
-        try:
-            resource_mult = world.calculate_resource_wave_multiplier()
-            fertility_mult = world.calculate_fertility_wave_multiplier()
-            mortality_mult = world.calculate_mortality_wave_multiplier()
-        except Exception:
-            resource_mult = fertility_mult = mortality_mult = 1.0
-
-        # Run simulation step
-        world.world_tick()
-
-        # Track population
-        current_pop = len(faction.npc_ids)
-        populations.append(current_pop)
-        wave_data.append(
-            {
-                "tick": tick,
-                "population": current_pop,
-                "resource_mult": resource_mult,
-                "fertility_mult": fertility_mult,
-                "mortality_mult": mortality_mult,
-            }
-        )
-
-        # Print status every 100 ticks
-        if tick % 100 == 0:
-            print(
-                f"{tick:4d} | {current_pop:3d} | {resource_mult:12.3f} | {fertility_mult:13.3f} | {mortality_mult:13.3f}"
-            )
-
-    elapsed = time.time() - start_time
-    print()
-    print(f"Simulation completed in {elapsed:.2f} seconds")
-    print()
-
-    # Analyze results
-    final_pop = len(faction.npc_ids)
-    min_pop = min(populations)
-    max_pop = max(populations)
-    avg_pop = sum(populations) / len(populations)
-
-    print("Population Statistics:")
-    print(f"  Initial Population: {spawn_count}")
-    print(f"  Final Population: {final_pop}")
-    print(f"  Minimum Population: {min_pop}")
-    print(f"  Maximum Population: {max_pop}")
-    print(f"  Average Population: {avg_pop:.1f}")
-    print(f"  Population Range: {max_pop - min_pop}")
-    print()
-
-    # Check for wave effects
-    wave_range_resource = max(d["resource_mult"] for d in wave_data) - min(
-        d["resource_mult"] for d in wave_data
-    )
-    wave_range_fertility = max(d["fertility_mult"] for d in wave_data) - min(
-        d["fertility_mult"] for d in wave_data
-    )
-    wave_range_mortality = max(d["mortality_mult"] for d in wave_data) - min(
-        d["mortality_mult"] for d in wave_data
-    )
-
-    print("Wave Multiplier Ranges:")
-    print(f"  Resource Wave Range: {wave_range_resource:.3f}")
-    print(f"  Fertility Wave Range: {wave_range_fertility:.3f}")
-    print(f"  Mortality Wave Range: {wave_range_mortality:.3f}")
-    print()
-
-    # Success criteria
-    success = True
-
-    if wave_range_resource < 0.5:
-        print("WARNING: Resource wave range seems too small")
-        success = False
-
-    if wave_range_fertility < 0.3:
-        print("WARNING: Fertility wave range seems too small")
-        success = False
-
-    if wave_range_mortality < 0.2:
-        print("WARNING: Mortality wave range seems too small")
-        success = False
-
-    if max_pop - min_pop < 5:
-        print("WARNING: Population fluctuation seems too small for wave effects")
-        success = False
-
-    if success:
-        print("✅ Population wave system appears to be working correctly!")
-    else:
-        print("❌ Population wave system may not be working as expected")
-
-    return success
+        spawned = [
+            NPC(name=f"wave_test_{i}", coordinates=(0, 0), faction_id="TestWaveFaction")
+            for i in range(spawn_count)
+        ]
+        for npc in spawned:
+            npc.age = 50  # Prime age
+        world.active_chunks[(0, 0)].npcs.extend(spawned)
+        faction.add_members(npc.name for npc in spawned)
+
+        # Add faction territory
+        faction.territory = [(0, 0)]
+
+        # Run simulation and track population over time
+        total_ticks = 2000  # Enough to see multiple wave cycles
+        # Parallel preallocated typed columns (unboxed storage) instead of one dict per tick
+        populations = array("l", [0]) * total_ticks
+        resource_mults = array("d", [1.0]) * total_ticks
+        fertility_mults = array("d", [1.0]) * total_ticks
+        mortality_mults = array("d", [1.0]) * total_ticks
+
+        print(f"Running simulation for {total_ticks} ticks...")
+        print("Tick | Pop | Resource Wave | Fertility Wave | Mortality Wave")
+        print("-" * 65)
+
+        start_time = time.time()
+
+        # World methods bound once outside the tick loop
+        resource_wave = world.calculate_resource_wave_multiplier
+        fertility_wave = world.calculate_fertility_wave_multiplier
+        mortality_wave = world.calculate_mortality_wave_multiplier
+        world_tick = world.world_tick
+
+        # Status lines are buffered and written in one call every 500 ticks
+        log_lines = []
+        for tick in range(total_ticks):
+            # Capture wave multipliers
+            try:
+                resource_mult = resource_wave()
+                fertility_mult = fertility_wave()
+                mortality_mult = mortality_wave()
+            except Exception:
+                resource_mult = fertility_mult = mortality_mult = 1.0
+
+            # Run simulation step
+            world_tick()
+
+            # Track population
+            current_pop = len(faction.npc_ids)
+            populations[tick] = current_pop
+            resource_mults[tick] = resource_mult
+            fertility_mults[tick] = fertility_mult
+            mortality_mults[tick] = mortality_mult
+
+            # Log status every 100 ticks
+            if tick % 100 == 0:
+                log_lines.append(
+                    f"{tick:4d} | {current_pop:3d} | {resource_mult:12.3f} | {fertility_mult:13.3f} | {mortality_mult:13.3f}\n"
+                )
+            if tick % 500 == 0 or tick == total_ticks - 1:
+                sys.stdout.write("".join(log_lines))
+                sys.stdout.flush()
+                log_lines.clear()
+
+        elapsed = time.time() - start_time
+        print()
+        print(f"Simulation completed in {elapsed:.2f} seconds")
+        print()
+
+        # Analyze results
+        final_pop = len(faction.npc_ids)
+        min_pop = min(populations)
+        max_pop = max(populations)
+        avg_pop = sum(populations) / len(populations)
+
+        print("Population Statistics:")
+        print(f"  Initial Population: {spawn_count}")
+        print(f"  Final Population: {final_pop}")
+        print(f"  Minimum Population: {min_pop}")
+        print(f"  Maximum Population: {max_pop}")
+        print(f"  Average Population: {avg_pop:.1f}")
+        print(f"  Population Range: {max_pop - min_pop}")
+        print()
+
+        # Check for wave effects
+        wave_range_resource = max(resource_mults) - min(resource_mults)
+        wave_range_fertility = max(fertility_mults) - min(fertility_mults)
+        wave_range_mortality = max(mortality_mults) - min(mortality_mults)
+
+        print("Wave Multiplier Ranges:")
+        print(f"  Resource Wave Range: {wave_range_resource:.3f}")
+        print(f"  Fertility Wave Range: {wave_range_fertility:.3f}")
+        print(f"  Mortality Wave Range: {wave_range_mortality:.3f}")
+        print()
+
+        # Success criteria
+        success = True
+
+        if wave_range_resource < 0.5:
+            print("WARNING: Resource wave range seems too small")
+            success = False
+
+        if wave_range_fertility < 0.3:
+            print("WARNING: Fertility wave range seems too small")
+            success = False
+
+        if wave_range_mortality < 0.2:
+            print("WARNING: Mortality wave range seems too small")
+            success = False
+
+        if max_pop - min_pop < 5:
+            print("WARNING: Population fluctuation seems too small for wave effects")
+            success = False
+
+        if success:
+            print("✅ Population wave system appears to be working correctly!")
+        else:
+            print("❌ Population wave system may not be working as expected")
+
+        return success
+    finally:
+        if listener is not None:
+            listener.stop()
+            logging.getLogger().removeHandler(queue_handler)
 
 
 if __name__ == "__main__":
@@ -9,43 +9,19 @@ import os
 # Add the main directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from world.engine import WorldEngine
-from factions.faction import Faction
-from npcs.npc import NPC
-import random
+from _population_setup import build_two_faction_world
 
 
 def simple_population_test():
     """Simple test without parallelism to track population changes."""
     print("Running simple population test...")
 
-    # Set up a minimal world simulation
-    random.seed(42)
-    world = WorldEngine(seed=42)
-
-    # Disable parallelism to avoid crashes
-    world.use_parallelism = False
-
-    # Create two factions with initial populations
-    faction_a = Faction(name="TestA", territory=[(0, 0)])
-    faction_b = Faction(name="TestB", territory=[(1, 1)])
-
-    world.factions["TestA"] = faction_a
-    world.factions["TestB"] = faction_b
-
-    # Initial population setup
-    initial_pop_per_faction = 5  # Smaller initial pop to avoid explosive growth
-    for faction_name, faction in [("TestA", faction_a), ("TestB", faction_b)]:
-        territory = faction.territory[0] if faction.territory else (0, 0)
-        for i in range(initial_pop_per_faction):
-            npc = NPC(
-                name=f"{faction_name}_initial_{i}",
-                coordinates=territory,
-                faction_id=faction_name,
-            )
-            faction.add_member(npc.name)
-            world.get_chunk(*territory).npcs.append(npc)
-            world.activate_chunk(*territory)
+    # Set up a minimal world simulation; parallelism disabled to avoid crashes.
+    # Smaller initial pop per faction to avoid explosive growth.
+    initial_pop_per_faction = 5
+    world, faction_a, faction_b = build_two_faction_world(
+        initial_pop_per_faction, use_parallelism=False
+    )
 
     print(
         f"Initial setup: {len(faction_a.npc_ids)} + {len(faction_b.npc_ids)} = {len(faction_a.npc_ids) + len(faction_b.npc_ids)} total NPCs"
@@ -57,6 +33,8 @@ def simple_population_test():
     # Run simulation for moderate time to see pattern
     total_ticks = 1000
 
+    # Log lines are buffered and written in one call every 500 ticks and on exit
+    log_lines = []
     for tick in range(total_ticks):
         try:
             # World tick
@@ -64,8 +42,8 @@ def simple_population_test():
 
             # Log every 50 ticks
             if tick % 50 == 0 or tick == total_ticks - 1:
-                total_pop = sum(len(f.npc_ids) for f in world.factions.values())
-                total_food = sum(f.resources.get("food", 0) for f in world.factions.values())
+                total_pop = world.total_population()
+                total_food = world.total_food()
 
                 # Get birth/death stats
                 births = getattr(world, "_audit_births_tick", 0)
@@ -76,31 +54,32 @@ def simple_population_test():
                 pop_change = total_pop - previous_pop
                 previous_pop = total_pop
 
-                print(
-                    f"[TICK {tick:4d}] Pop: {total_pop:3d} ({pop_change:+3d}) | Food: {total_food:6.1f} | B/D: {births}/{starv_deaths + natural_deaths}"
+                log_lines.append(
+                    f"[TICK {tick:4d}] Pop: {total_pop:3d} ({pop_change:+3d}) | Food: {total_food:6.1f} | B/D: {births}/{starv_deaths + natural_deaths}\n"
                 )
 
                 # Check for extreme population drops
                 if total_pop < initial_pop_per_faction:
-                    print("  🚨 Population dropped below initial level!")
+                    log_lines.append("  🚨 Population dropped below initial level!\n")
                     break
 
                 # Check starvation pressure
                 for name, faction in world.factions.items():
                     pressure = getattr(faction, "_starvation_pressure", 0.0)
                     if pressure > 2.0:
-                        print(f"  ⚠️  {name} high starvation pressure: {pressure:.2f}")
-
-            # Reset per-tick counters
-            world._audit_births_tick = 0
-            world._audit_starvation_deaths_tick = 0
-            world._audit_natural_deaths_tick = 0
+                        log_lines.append(f"  ⚠️  {name} high starvation pressure: {pressure:.2f}\n")
 
         except Exception as e:
-            print(f"Error at tick {tick}: {e}")
+            log_lines.append(f"Error at tick {tick}: {e}\n")
             break
 
-    final_pop = sum(len(f.npc_ids) for f in world.factions.values())
+        if tick % 500 == 0:
+            sys.stdout.write("".join(log_lines))
+            sys.stdout.flush()
+            log_lines.clear()
+    sys.stdout.write("".join(log_lines))
+
+    final_pop = world.total_population()
     print(f"\nFinal population: {final_pop} (started with {initial_pop_per_faction * 2})")
 
     # Check balance parameters
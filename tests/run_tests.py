@@ -6,10 +6,17 @@ Automatically sets up the correct Python path for all tests.
 
 import os
 import sys
+import runpy
 import subprocess
 import argparse
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# --fork lets category runs fork children of this runner instead of starting an interpreter
+_CAN_FORK = hasattr(os, "fork")
+
 
 def get_project_root():
     """Get the project root directory (parent of tests/)."""
@@ -38,6 +45,104 @@ def run_test(test_path, args=None):
     return result.returncode
 
 
+def _run_test_captured(test_path):
+    """Run a test with the correct Python path, capturing its combined output."""
+    project_root = get_project_root()
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(project_root)
+
+    result = subprocess.run(
+        [sys.executable, test_path],
+        env=env,
+        cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return result.returncode, result.stdout
+
+
+def _exit_code(status):
+    """Convert an os.waitpid status to a subprocess-style return code."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _fork_test(test_path, output=None):
+    """Fork a child that runs ``test_path`` as ``__main__`` and return its pid.
+
+    The child mirrors ``run_test`` (project root as cwd, on sys.path and in PYTHONPATH
+    for any subprocesses it starts) but skips interpreter start-up. It is not a fresh
+    interpreter: modules the runner has already imported, and their state, are
+    inherited. The child leaves through a normal interpreter exit (SystemExit), so the
+    test's atexit handlers, logging shutdown and non-daemon thread joins all run. If
+    ``output`` (a binary file) is given, the child's stdout/stderr are redirected into it.
+    """
+    test_path = os.path.abspath(test_path)
+    project_root = os.path.abspath(get_project_root())
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    code = 1
+    try:
+        if output is not None:
+            os.dup2(output.fileno(), 1)
+            os.dup2(output.fileno(), 2)
+        os.chdir(project_root)
+        os.environ["PYTHONPATH"] = project_root
+        sys.path[:0] = [os.path.dirname(test_path), project_root]
+        sys.argv = [test_path]
+        runpy.run_path(test_path, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    except BaseException:
+        traceback.print_exc()
+    # Nothing in the runner catches SystemExit, so this unwinds straight to interpreter exit
+    raise SystemExit(code)
+
+
+def _run_test_forked(test_path):
+    """Run a test in a forked child, streaming its output."""
+    _, status = os.waitpid(_fork_test(test_path), 0)
+    return _exit_code(status)
+
+
+def _run_forked(test_files, jobs):
+    """Yield ``(test_file, return_code, output)`` in order, keeping up to ``jobs`` forks busy."""
+    pending = iter(test_files)
+    running = {}
+    done = {}
+    for test_file in test_files:
+        while test_file not in done:
+            while len(running) < jobs:
+                nxt = next(pending, None)
+                if nxt is None:
+                    break
+                output = tempfile.TemporaryFile()
+                running[_fork_test(str(nxt), output)] = (nxt, output)
+            pid, status = os.waitpid(-1, 0)
+            finished, output = running.pop(pid)
+            output.seek(0)
+            done[finished] = (_exit_code(status), output.read().decode(errors="replace"))
+            output.close()
+        yield (test_file,) + done.pop(test_file)
+
+
+def _run_subprocesses(test_files, jobs):
+    """Yield ``(test_file, return_code, output)`` in order from a pool of subprocess runs."""
+    # Threads suffice: the work happens in the child processes
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        results = ex.map(_run_test_captured, [str(tf) for tf in test_files])
+        for test_file, (return_code, output) in zip(test_files, results):
+            yield test_file, return_code, output
+
+
 def list_tests():
     """List all available tests."""
     tests_dir = Path(__file__).parent
@@ -64,8 +169,14 @@ def list_tests():
                 print(f"  {category}/{test_file.name}")
 
 
-def run_category(category):
-    """Run all tests in a category."""
+def run_category(category, jobs=1, fork=False):
+    """Run all tests in a category.
+
+    Each test runs in its own interpreter, or with ``fork`` (where supported) in a child
+    forked from this runner, up to ``jobs`` at a time; with more than one job their
+    captured output is printed in file-name order. Tests share on-disk state (persistence/,
+    world_data/), so only raise ``jobs`` for categories whose tests do not.
+    """
     tests_dir = Path(__file__).parent
     category_dir = tests_dir / category
 
@@ -81,13 +192,30 @@ def run_category(category):
     print(f"Running all tests in category: {category}")
     print("=" * 60)
 
+    test_files = sorted(test_files)
+    jobs = max(1, min(jobs, len(test_files)))
+
+    fork = fork and _CAN_FORK
     failed_tests = []
-    for test_file in sorted(test_files):
-        print(f"\n>>> Running {category}/{test_file.name}")
-        return_code = run_test(str(test_file))
-        if return_code != 0:
-            failed_tests.append(f"{category}/{test_file.name}")
-        print(f"<<< {category}/{test_file.name} completed with code {return_code}")
+    if jobs == 1:
+        for test_file in test_files:
+            print(f"\n>>> Running {category}/{test_file.name}")
+            if fork:
+                return_code = _run_test_forked(str(test_file))
+            else:
+                return_code = run_test(str(test_file))
+            if return_code != 0:
+                failed_tests.append(f"{category}/{test_file.name}")
+            print(f"<<< {category}/{test_file.name} completed with code {return_code}")
+    else:
+        run_all = _run_forked if fork else _run_subprocesses
+        for test_file, return_code, output in run_all(test_files, jobs):
+            print(f"\n>>> Running {category}/{test_file.name}")
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            if return_code != 0:
+                failed_tests.append(f"{category}/{test_file.name}")
+            print(f"<<< {category}/{test_file.name} completed with code {return_code}")
 
     if failed_tests:
         print(f"\n❌ {len(failed_tests)} test(s) failed:")
@@ -103,6 +231,19 @@ def main():
     parser = argparse.ArgumentParser(description="AI Sandbox Test Runner")
     parser.add_argument("--list", action="store_true", help="List all available tests")
     parser.add_argument("--category", help="Run all tests in a category")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Max tests to run concurrently with --category (default: 1; tests share "
+        "persistence/ and world_data/ files)",
+    )
+    parser.add_argument(
+        "--fork",
+        action="store_true",
+        help="With --category, fork each test from the runner instead of starting a new "
+        "interpreter (faster start-up; tests inherit the runner's imported modules)",
+    )
     parser.add_argument("test_path", nargs="?", help="Path to specific test file")
     parser.add_argument("test_args", nargs="*", help="Arguments to pass to the test")
 
@@ -113,7 +254,7 @@ def main():
         return 0
 
     if args.category:
-        return run_category(args.category)
+        return run_category(args.category, args.jobs, args.fork)
 
     if args.test_path:
         return run_test(args.test_path, args.test_args)
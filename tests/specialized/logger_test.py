@@ -1,8 +1,16 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 logHandler = logging.FileHandler("log.txt", mode="w", encoding="utf-8")
 formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
 logHandler.setFormatter(formatter)
-logging.basicConfig(level=logging.DEBUG, handlers=[logHandler])
+# Callers only enqueue records; a listener thread formats and writes them to the file
+log_queue = queue.SimpleQueue()
+listener = QueueListener(log_queue, logHandler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+logging.basicConfig(level=logging.DEBUG, format="%(message)s", handlers=[QueueHandler(log_queue)])
 logger = logging.getLogger(__name__)
 logger.info("Test log entry")
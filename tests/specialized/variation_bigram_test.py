@@ -21,21 +21,14 @@ print("=== Bigram Diversity Test (idle, 30 lines) ===")
 for i, line in enumerate(lines, 1):
     print(f"{i:02d}: {line}")
 
-# Compute consecutive overlap ratios
+# Compute consecutive overlap ratios (each line's bigram set is built once)
 print("\nConsecutive bigram overlap ratios:")
-prev = None
-for line in lines:
-    if prev is None:
-        print(" - (first)")
-    else:
-        b_prev = set(bigrams(prev))
-        b_curr = set(bigrams(line))
-        if b_prev:
-            overlap = len(b_prev & b_curr) / len(b_prev)
-        else:
-            overlap = 0.0
-        print(f" {overlap:.2f}")
-    prev = line
+bigram_sets = [set(bigrams(line)) for line in lines]
+if bigram_sets:
+    print(" - (first)")
+for b_prev, b_curr in zip(bigram_sets, bigram_sets[1:]):
+    overlap = len(b_prev & b_curr) / len(b_prev) if b_prev else 0.0
+    print(f" {overlap:.2f}")
 
 # Top recurring lines count
 print("\nLine frequency counts:")
@@ -7,13 +7,16 @@ This script implements a comprehensive approach to achieve 100% coverage of the
 """
 
 import argparse
+import gc
 import json
+import multiprocessing as mp
 import os
 import random
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from typing import List, Set, Tuple, Dict
-from collections import defaultdict
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import Counter
 import csv
 
 # --------------------------------------------------------------------------------------
@@ -21,7 +24,8 @@ import csv
 # --------------------------------------------------------------------------------------
 
 TOTAL_STATE_THEORETICAL = 647_280  # 15*12*8*8*7*8 = 647,280
-UNIQUE_STATES_FILE = "artifacts/checkpoints/military_unique_states_100p.json"
+UNIQUE_STATES_FILE = "artifacts/checkpoints/military_unique_states_100p.bin"  # packed uint32 ids
+LEGACY_UNIQUE_STATES_FILE = "artifacts/checkpoints/military_unique_states_100p.json"
 CHECKPOINT_DIR = "artifacts/checkpoints"
 MODEL_DIR = "artifacts/models"
 METRICS_CSV = "artifacts/military_training_metrics.csv"
@@ -29,6 +33,37 @@ METRICS_CSV = "artifacts/military_training_metrics.csv"
 # State space dimensions
 STATE_DIMS = [15, 12, 8, 8, 7, 8]  # power_ratio, tech_advantage, diplomatic, resource, force, territory
 
+# Tribe territories are diamonds (Manhattan radius) capped to avoid world boundary issues; the
+# cell offsets per radius are built once, in the same dx-major order as before
+MAX_TERRITORY_RADIUS = 8
+TERRITORY_OFFSETS = {
+    radius: tuple(
+        (dx, dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+        if abs(dx) + abs(dy) <= radius
+    )
+    for radius in range(MAX_TERRITORY_RADIUS + 1)
+}
+
+# Mixed-radix place values for packing a state tuple into a single int id
+_STATE_STRIDES = (12 * 8 * 8 * 7 * 8, 8 * 8 * 7 * 8, 8 * 7 * 8, 7 * 8, 8, 1)
+
+# Scenarios for the current run; workers index into this instead of receiving a copy per episode
+_SCENARIOS: List[Dict] = []
+
+# Simulation classes/functions episodes need, imported once per worker by _import_episode_deps
+_EPISODE_DEPS: Dict[str, object] = {}
+
+# Episodes end early after this many ticks without a state new to the episode
+EPISODE_PLATEAU_TICKS = 30
+
+# Process workers run with automatic GC off and collect generation 0 after every episode;
+# every this many of those collections also covers generation 1
+GC_GEN1_EVERY_COLLECTIONS = 10
+_manual_gc = False
+_gen0_collections = 0
+
 # --------------------------------------------------------------------------------------
 # Utility Functions
 # --------------------------------------------------------------------------------------
@@ -37,35 +72,85 @@ def ensure_dirs():
     os.makedirs(CHECKPOINT_DIR, exist_ok=True)
     os.makedirs(MODEL_DIR, exist_ok=True)
 
-def load_unique_states() -> Set[Tuple[int, int, int, int, int, int]]:
-    if not os.path.exists(UNIQUE_STATES_FILE):
+def pack_state(state) -> Optional[int]:
+    """Pack a discretised state into its flat id in ``[0, TOTAL_STATE_THEORETICAL)``.
+
+    Returns None for states with a bin outside ``STATE_DIMS`` (e.g. a value below the first
+    bin edge), which are not part of the state space being covered.
+    """
+    packed = 0
+    for value, dim, stride in zip(state, STATE_DIMS, _STATE_STRIDES):
+        value = int(value)
+        if not 0 <= value < dim:
+            return None
+        packed += value * stride
+    return packed
+
+def unpack_state(packed: int) -> Tuple[int, int, int, int, int, int]:
+    """Inverse of :func:`pack_state`."""
+    state = []
+    for stride in _STATE_STRIDES:
+        value, packed = divmod(packed, stride)
+        state.append(value)
+    return tuple(state)
+
+def load_unique_states() -> Set[int]:
+    if os.path.exists(UNIQUE_STATES_FILE):
+        try:
+            ids = array("I")
+            with open(UNIQUE_STATES_FILE, "rb") as f:
+                ids.frombytes(f.read())
+            return set(ids)
+        except Exception:
+            return set()
+    # Fall back to the JSON list-of-tuples format written by earlier runs
+    if not os.path.exists(LEGACY_UNIQUE_STATES_FILE):
         return set()
     try:
-        with open(UNIQUE_STATES_FILE, "r") as f:
+        with open(LEGACY_UNIQUE_STATES_FILE, "r") as f:
             data = json.load(f)
         raw_states = data.get("states", [])
-        return {tuple(s) for s in raw_states if isinstance(s, list) and len(s) == 6}
+        packed = (pack_state(s) for s in raw_states if isinstance(s, list) and len(s) == 6)
+        return {p for p in packed if p is not None}
     except Exception:
         return set()
 
-def save_unique_states(states: Set[Tuple[int, int, int, int, int, int]]):
+def save_unique_states(states: Iterable[int]):
+    """Write state ids as a flat uint32 array (4 bytes per state).
+
+    Accepts a snapshot ``array("I")`` so a background writer never iterates the live set.
+    """
+    ids = states if isinstance(states, array) else array("I", states)
+    tmp_path = UNIQUE_STATES_FILE + ".tmp"
     try:
-        with open(UNIQUE_STATES_FILE, "w") as f:
-            json.dump({"count": len(states), "states": [list(s) for s in states]}, f, indent=2)
+        with open(tmp_path, "wb") as f:
+            ids.tofile(f)
+        os.replace(tmp_path, UNIQUE_STATES_FILE)
     except Exception as e:
         print(f"[WARN] Failed saving unique states: {e}")
 
-def analyze_coverage_gaps(unique_states: Set[Tuple]) -> Dict:
-    """Analyze which state combinations are missing."""
+def analyze_coverage_gaps(unique_states: Set[int]) -> Dict:
+    """Analyze which state combinations are missing, given packed state ids."""
     if not unique_states:
         return {"missing_bins": {}, "total_missing": TOTAL_STATE_THEORETICAL}
 
-    # Count occurrences per bin per dimension
-    bin_counts = [defaultdict(int) for _ in range(6)]
-    for state in unique_states:
-        for dim, value in enumerate(state):
-            bin_counts[dim][value] += 1
+    bin_counts = empty_bin_counts()
+    update_bin_counts(bin_counts, unique_states)
+    return coverage_gaps_from_counts(bin_counts)
+
+def empty_bin_counts() -> List[List[int]]:
+    """Dense per-dimension occurrence counts, indexed by bin."""
+    return [[0] * size for size in STATE_DIMS]
 
+def update_bin_counts(bin_counts: List[List[int]], new_states: Iterable[int]):
+    """Fold newly discovered packed state ids into per-dimension ``bin_counts`` in place."""
+    # Transpose once and count each column in C, then add into the dense lists
+    for counts, column in zip(bin_counts, zip(*map(unpack_state, new_states))):
+        for bin_idx, n in Counter(column).items():
+            counts[bin_idx] += n
+
+def coverage_gaps_from_counts(bin_counts: List[List[int]]) -> Dict:
+    """Derive missing bins from per-dimension counts; O(bins) rather than O(states)."""
     missing_bins = {}
     total_missing = 0
 
@@ -96,6 +181,11 @@ def generate_targeted_scenarios(gaps: Dict, num_scenarios: int = 100) -> List[Di
         # Create default missing bins for all dimensions
         gaps["missing_bins"] = {i: list(range(STATE_DIMS[i])) for i in range(6)}
 
+    # Dimensions the tribe configs can steer (force_readiness, territory_control), weighted by how
+    # many bins each is still missing so a nearly covered dimension doesn't claim every scenario
+    target_dims = [dim for dim in (4, 5) if gaps["missing_bins"].get(dim)]
+    target_weights = [len(gaps["missing_bins"][dim]) for dim in target_dims]
+
     for _ in range(num_scenarios):
         scenario = {
             "target_dims": [],
@@ -103,13 +193,14 @@ def generate_targeted_scenarios(gaps: Dict, num_scenarios: int = 100) -> List[Di
             "world_seed": random.randint(0, 9999999)
         }
 
-        # Focus on missing dimensions
-        if 4 in gaps["missing_bins"] and gaps["missing_bins"][4]:  # force_readiness missing bin 0
-            scenario["target_dims"].append(4)
-            scenario["force_readiness_target"] = 0
-        if 5 in gaps["missing_bins"] and gaps["missing_bins"][5]:  # territory_control missing bins 0,7
-            scenario["target_dims"].append(5)
-            scenario["territory_target"] = random.choice(gaps["missing_bins"][5])
+        # Focus on one missing dimension
+        if target_dims:
+            dim = random.choices(target_dims, weights=target_weights)[0]
+            scenario["target_dims"].append(dim)
+            if dim == 4:  # force_readiness missing bin 0
+                scenario["force_readiness_target"] = 0
+            else:  # territory_control missing bins 0,7
+                scenario["territory_target"] = random.choice(gaps["missing_bins"][5])
 
         # Create tribe configurations to hit these targets
         num_tribes = random.randint(12, 20)  # Increased range for more diversity
@@ -132,22 +223,114 @@ def generate_targeted_scenarios(gaps: Dict, num_scenarios: int = 100) -> List[Di
 # Enhanced Episode Worker
 # --------------------------------------------------------------------------------------
 
+def _import_episode_deps() -> Dict[str, object]:
+    """Import the simulation modules once per worker rather than on every episode.
+
+    Kept out of module scope so importing this script stays cheap; also used as the
+    thread-pool initializer, so episode threads don't contend on the import lock.
+    """
+    if not _EPISODE_DEPS:
+        from world.engine import WorldEngine
+        from tribes.tribal_manager import TribalManager
+        from rl_military_agent import MilitaryRLAgent
+        from rl_military_interface import execute_military_action, compute_military_reward
+        from technology_system import technology_manager
+        from factions.faction import Faction
+
+        _EPISODE_DEPS.update(
+            WorldEngine=WorldEngine,
+            TribalManager=TribalManager,
+            MilitaryRLAgent=MilitaryRLAgent,
+            execute_military_action=execute_military_action,
+            compute_military_reward=compute_military_reward,
+            technology_manager=technology_manager,
+            Faction=Faction,
+        )
+    return _EPISODE_DEPS
+
+def _init_worker_scenarios(scenarios: List[Dict], worker_counter=None):
+    """Process-pool initializer: install the run's scenarios and imports once per worker.
+
+    Forked workers already inherit ``_SCENARIOS``; spawned ones receive it here, pickled
+    once per worker rather than once per episode. Each worker is also pinned to its own core
+    (taking the next slot from the shared ``worker_counter``, where the platform supports
+    affinity) and switches off automatic GC; see :func:`_collect_episode_garbage`.
+    """
+    global _SCENARIOS, _manual_gc
+    _SCENARIOS = scenarios
+    _import_episode_deps()
+
+    if worker_counter is not None and hasattr(os, "sched_setaffinity"):
+        with worker_counter.get_lock():
+            worker_idx = worker_counter.value
+            worker_counter.value += 1
+        cpus = sorted(os.sched_getaffinity(0))
+        try:
+            os.sched_setaffinity(0, {cpus[worker_idx % len(cpus)]})
+        except OSError:
+            pass
+
+    # Move everything loaded so far out of the collector's view, then collect by hand
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+    gc.disable()
+    _manual_gc = True
+
+def _collect_episode_garbage():
+    """In process workers (automatic GC off), collect the young generation after an episode.
+
+    Called once an episode has returned, so its cyclic world graph is already garbage and is
+    reclaimed from generation 0 rather than promoted. Every GC_GEN1_EVERY_COLLECTIONS-th
+    collection also covers generation 1, for anything that was promoted regardless.
+    """
+    global _gen0_collections
+    if not _manual_gc:
+        return
+    _gen0_collections += 1
+    if _gen0_collections >= GC_GEN1_EVERY_COLLECTIONS:
+        gc.collect(1)
+        _gen0_collections = 0
+    else:
+        gc.collect(0)
+
 def run_targeted_episode_worker(args):
-    """Run episode with specific targeting for missing state combinations."""
+    """Pool entry point: run one episode, then collect its garbage in the worker.
+
+    The collection runs here, after :func:`_run_targeted_episode` has returned, so the
+    episode's world, agent and tribal manager are no longer referenced by a live frame.
+    """
+    try:
+        return _run_targeted_episode(args)
+    finally:
+        _collect_episode_garbage()
+
+def _run_targeted_episode(args):
+    """Run episode with specific targeting for missing state combinations.
+
+    The episode's Q-table is only returned when ``return_q`` is set (i.e. the caller merges
+    Q-tables); with a process executor every returned table is pickled back to the parent.
+    """
     (
         episode_num,
-        scenario_config,
+        scenario_index,
         base_epsilon,
         debug,
+        return_q,
     ) = args
+    scenario_config = _SCENARIOS[scenario_index]
 
-    # Local imports for isolation (avoids cost at module import time)
-    from world.engine import WorldEngine
-    from tribes.tribal_manager import TribalManager
-    from rl_military_agent import MilitaryRLAgent
-    from rl_military_interface import execute_military_action, compute_military_reward
+    deps = _import_episode_deps()
+    WorldEngine = deps["WorldEngine"]
+    TribalManager = deps["TribalManager"]
+    MilitaryRLAgent = deps["MilitaryRLAgent"]
+    execute_military_action = deps["execute_military_action"]
+    compute_military_reward = deps["compute_military_reward"]
 
-    random.seed(scenario_config["world_seed"] + episode_num * 137)
+    # The trainer's own draws use an episode-local generator rather than reseeding the shared
+    # module one, which concurrent thread workers would clobber (the engine still seeds that
+    # one for the simulation itself)
+    rng = random.Random(scenario_config["world_seed"] + episode_num * 137)
 
     try:
         world = WorldEngine(seed=scenario_config["world_seed"], disable_faction_saving=True)
@@ -169,54 +352,83 @@ def run_targeted_episode_worker(args):
             print(f"[DBG ep{episode_num}] created {len(tribes)} tribes for targeted scenario")
 
         if len(tribal_manager.tribes) < 3:
-            return {"episode": episode_num, "states_visited": [], "success": True}
+            return {"episode": episode_num, "states_visited": b"", "success": True}
 
         states_visited = set()
         q_updates = 0
 
+        # Actor/target draws, with the generator's methods bound once
+        randint, randrange, sample = rng.randint, rng.randrange, rng.sample
+
+        # Bind the per-decision methods once; the loop below runs ~1000 decisions per episode
+        world_tick = world.world_tick
+        live_tribes = tribal_manager.tribes
+        get_state = agent.get_military_state
+        choose_action = agent.choose_action
+        get_action_name = agent.get_action_name
+        update_q_table = agent.update_q_table
+        q_table = agent.q_table
+        add_visited = states_visited.add
+
         # Extended decision loop for better exploration
-        for _tick in range(0, 200, 3):  # Longer episodes
-            world.world_tick()
-            active = list(tribal_manager.tribes.values())
-            if len(active) < 3:
+        last_new_tick = 0
+        visited_before = 0
+        for tick in range(0, 200, 3):  # Longer episodes
+            # Cut the episode short once it has stopped reaching states it hasn't seen
+            if len(states_visited) > visited_before:
+                visited_before = len(states_visited)
+                last_new_tick = tick
+            elif tick - last_new_tick > EPISODE_PLATEAU_TICKS:
+                break
+
+            world_tick()
+            active = list(live_tribes.values())
+            num_active = len(active)
+            if num_active < 3:
                 continue
 
-            decisions = random.randint(12, 20)  # Increased from 8-12 to 12-20
+            decisions = randint(12, 20)  # Increased from 8-12 to 12-20
             for _ in range(decisions):
-                actor = random.choice(active)
-                targets_pool = [t for t in active if t != actor]
-                if len(targets_pool) < 2:
-                    continue
+                actor_idx = randrange(num_active)
+                actor = active[actor_idx]
+                # Everyone but the actor, by position rather than comparing each tribe to it
+                targets_pool = active[:actor_idx] + active[actor_idx + 1:]
 
-                sel_count = min(len(targets_pool), random.randint(3, 7))  # Increased from 2-5 to 3-7
-                selected = random.sample(targets_pool, sel_count)
+                sel_count = min(num_active - 1, randint(3, 7))  # Increased from 2-5 to 3-7
+                selected = sample(targets_pool, sel_count)
 
-                state = agent.get_military_state(actor, selected, world)
+                state = get_state(actor, selected, world)
                 if state is None:
                     continue
 
-                states_visited.add(tuple(int(x) for x in state))
-                action_idx = agent.choose_action(state)
-                action_name = agent.get_action_name(action_idx)
+                packed = pack_state(state)
+                if packed is not None:
+                    add_visited(packed)
+                action_idx = choose_action(state)
+                action_name = get_action_name(action_idx)
 
                 action_results = execute_military_action(action_name, actor, selected, tribal_manager, world)
-                next_state = agent.get_military_state(actor, selected, world)
+                next_state = get_state(actor, selected, world)
                 reward = compute_military_reward(action_results, state, next_state)
 
                 if next_state is not None:
-                    agent.update_q_table(state, action_idx, reward, next_state)
+                    update_q_table(state, action_idx, reward, next_state)
                     q_updates += 1
 
-                # Force Q-table entry
-                agent.q_table[state]
+                # Force Q-table entry; only matters when the table is shipped back for merging
+                if return_q:
+                    q_table[state]
 
-        return {
+        result = {
             "episode": episode_num,
-            "q_table": agent.q_table,
-            "states_visited": [list(s) for s in states_visited],
+            # Packed uint32 ids as one bytes blob: pickled as a single buffer, not int by int
+            "states_visited": array("I", states_visited).tobytes(),
             "stats": {"q_updates": q_updates, "states": len(states_visited)},
             "success": True,
         }
+        if return_q:
+            result["q_table"] = agent.q_table
+        return result
 
     except Exception as e:
         import traceback
@@ -225,10 +437,11 @@ def run_targeted_episode_worker(args):
 
 def create_targeted_tribe(tribal_manager, world, episode_num, tribe_idx, config, world_seed):
     """Create tribe with specific configuration to target missing states."""
-    from technology_system import technology_manager
-    from factions.faction import Faction
+    deps = _import_episode_deps()
+    technology_manager = deps["technology_manager"]
+    Faction = deps["Faction"]
 
-    random.seed(world_seed * 1000 + episode_num * 997 + tribe_idx * 13)
+    rng = random.Random(world_seed * 1000 + episode_num * 997 + tribe_idx * 13)
 
     archetypes = [
         ("Outpost", config["population_range"], 0.3),
@@ -241,38 +454,34 @@ def create_targeted_tribe(tribal_manager, world, episode_num, tribe_idx, config,
         ("Capital", config["population_range"], 7.5),
     ]
 
-    name_root, pop_range, res_mult = random.choice(archetypes)
+    name_root, pop_range, res_mult = rng.choice(archetypes)
     base_name = f"{name_root}_{episode_num}_{tribe_idx}"
 
     faction = Faction(name=base_name)
-    faction.population = random.randint(*pop_range)
+    faction.population = rng.randint(*pop_range)
 
     # Targeted resource levels
-    base_resources = max(10, int(random.randint(10, 100) * config["resource_multiplier"]))
+    base_resources = max(10, int(rng.randint(10, 100) * config["resource_multiplier"]))
     faction.resources = {
-        "food": float(max(1, int(random.randint(1, max(10, base_resources // 3)) + base_resources * random.uniform(0.5, 2.0)))),
-        "Wood": float(max(1, int(random.randint(1, max(10, base_resources // 3)) + base_resources * random.uniform(0.5, 2.0)))),
-        "Ore": float(max(1, int(random.randint(1, max(5, base_resources // 6)) + base_resources * random.uniform(0.5, 2.0)))),
+        "food": float(max(1, int(rng.randint(1, max(10, base_resources // 3)) + base_resources * rng.uniform(0.5, 2.0)))),
+        "Wood": float(max(1, int(rng.randint(1, max(10, base_resources // 3)) + base_resources * rng.uniform(0.5, 2.0)))),
+        "Ore": float(max(1, int(rng.randint(1, max(5, base_resources // 6)) + base_resources * rng.uniform(0.5, 2.0)))),
     }
 
     # Targeted territory
-    territory_radius = min(config["territory_radius"], 8)  # Cap at 8 to avoid world boundary issues
-    territory = []
-    cx = random.randint(-40, 40)  # Reduced range to avoid edge issues
-    cy = random.randint(-40, 40)
-    for dx in range(-territory_radius, territory_radius + 1):
-        for dy in range(-territory_radius, territory_radius + 1):
-            if abs(dx) + abs(dy) <= territory_radius:
-                territory.append((cx + dx, cy + dy))
-    faction.territory = territory
-
-    # Diplomatic relationships with bias
+    territory_radius = min(config["territory_radius"], MAX_TERRITORY_RADIUS)
+    cx = rng.randint(-40, 40)  # Reduced range to avoid edge issues
+    cy = rng.randint(-40, 40)
+    faction.territory = [(cx + dx, cy + dy) for dx, dy in TERRITORY_OFFSETS[territory_radius]]
+
+    # Diplomatic relationships with bias: draw the new faction's row in one pass, then mirror it
+    bias = config["diplomatic_bias"]
+    uniform = rng.uniform
+    rels = {name: max(-1.0, min(1.0, bias + uniform(-0.2, 0.2))) for name in world.factions}
+    faction.relationships.update(rels)
     for existing_name, existing_faction in world.factions.items():
-        rel = config["diplomatic_bias"] + random.uniform(-0.2, 0.2)
-        rel = max(-1.0, min(1.0, rel))
-        faction.relationships[existing_name] = rel
         if isinstance(existing_faction, Faction):
-            existing_faction.relationships[base_name] = rel
+            existing_faction.relationships[base_name] = rels[existing_name]
 
     # Targeted technology unlocks
     all_techs = [
@@ -286,7 +495,7 @@ def create_targeted_tribe(tribal_manager, world, episode_num, tribe_idx, config,
         # Ensure we don't try to sample more techs than available
         max_techs = len(all_techs)
         actual_unlock_count = min(unlock_count, max_techs)
-        technology_manager.unlocked_technologies[base_name] = set(random.sample(all_techs, actual_unlock_count))
+        technology_manager.unlocked_technologies[base_name] = set(rng.sample(all_techs, actual_unlock_count))
     else:
         technology_manager.unlocked_technologies[base_name] = set()
 
@@ -300,6 +509,37 @@ def create_targeted_tribe(tribal_manager, world, episode_num, tribe_idx, config,
 
     return tribal_manager.tribes[base_name]
 
+class InlineExecutor:
+    """Runs episodes one after another in the trainer process: no pool, no pickling.
+
+    Suits short episodes (common late in training, once most end on a plateau), where
+    dispatching to a pool costs more than the parallelism gains.
+    """
+
+    def map(self, fn, *iterables, chunksize=1):
+        return map(fn, *iterables)
+
+    def shutdown(self, wait=True):
+        pass
+
+def make_episode_pool(executor_type: str, workers: int, scenarios: List[Dict]):
+    """Executor for episode workers; process workers get ``scenarios`` installed up front."""
+    if executor_type == "inline":
+        return InlineExecutor()
+    if executor_type == "thread":
+        return ThreadPoolExecutor(max_workers=workers, initializer=_import_episode_deps)
+    # Fork shares the scenarios copy-on-write; spawn-only platforms get them via the initializer
+    start_method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+    mp_context = mp.get_context(start_method)
+    # Hands each worker a distinct index for core pinning
+    worker_counter = mp_context.Value("i", 0)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker_scenarios,
+        initargs=(scenarios, worker_counter),
+    )
+
 # --------------------------------------------------------------------------------------
 # Main 100% Coverage Training
 # --------------------------------------------------------------------------------------
@@ -308,7 +548,7 @@ def train_100_percent(
     episodes: int,
     workers: int = 8,
     resume: bool = True,
-    executor_type: str = "thread",
+    executor_type: str = "process",
     merge_q: bool = True,
     adaptive_batch: bool = False,
     batch_initial: int = 50,
@@ -330,16 +570,7 @@ def train_100_percent(
     # Initialize metrics CSV
     csv_writer = None
     csv_file = None
-    if adaptive_batch or True:  # Always log for now
-        csv_file = open(METRICS_CSV, 'w', newline='')
-        csv_writer = csv.writer(csv_file)
-        csv_writer.writerow([
-            'batch_start_ep', 'batch_end_ep', 'new_states', 'batch_seconds', 'ema_seconds',
-            'states_per_second', 'cumulative_states', 'coverage_percent', 'q_updates'
-        ])
-
-    # Initialize metrics CSV
-    csv_writer = None
+    metrics_rows = []
     if adaptive_batch or True:  # Always log for now
         csv_file = open(METRICS_CSV, 'w', newline='')
         csv_writer = csv.writer(csv_file)
@@ -369,7 +600,9 @@ def train_100_percent(
 
     # Phase 2: Generate targeted scenarios
     print("\n🎯 PHASE 2: Generating Targeted Scenarios...")
+    global _SCENARIOS
     scenarios = generate_targeted_scenarios(gaps, num_scenarios=2000)  # Increased from 1000
+    _SCENARIOS = scenarios
     print(f"Generated {len(scenarios)} targeted scenarios")
 
     # Phase 3: Execute training with systematic exploration
@@ -378,32 +611,40 @@ def train_100_percent(
     episode_count = 0
     batch_size = batch_initial if adaptive_batch else 200  # Increased default batch size
 
-    ExecutorClass = ThreadPoolExecutor if executor_type == "thread" else ProcessPoolExecutor
+    # Running per-dimension bin counts, updated with each batch's newly discovered states
+    bin_counts = gaps.get("bin_counts") or empty_bin_counts()
+
+    pool = make_episode_pool(executor_type, workers, scenarios)
     ema_batch_time = None
-    with ExecutorClass(max_workers=workers) as pool:
+    # Checkpoint writes run on one background thread so training continues while they flush
+    checkpoint_writer = ThreadPoolExecutor(max_workers=1)
+    pending_checkpoint = None
+    try:
         while episode_count < episodes and len(unique_states) < TOTAL_STATE_THEORETICAL:
             batch_start = episode_count
             batch_end = min(episode_count + batch_size, episodes)
             batch_t0 = time.time()
             states_before = len(unique_states)
 
-            batch_scenarios = random.sample(scenarios, min(batch_size, len(scenarios)))
+            batch_indices = random.sample(range(len(scenarios)), min(batch_size, len(scenarios)))
 
-            futures = []
-            for ep_idx in range(batch_start, batch_end):
-                scenario = batch_scenarios[ep_idx - batch_start]
+            def episode_args(ep_idx):
                 # Epsilon scheduling: high exploration early, decrease over time
                 progress_ratio = ep_idx / episodes
                 scheduled_epsilon = max(0.4, 0.9 - (progress_ratio * 0.5))  # 0.9 -> 0.4 over training
-                futures.append(
-                    pool.submit(
-                        run_targeted_episode_worker,
-                        (ep_idx, scenario, scheduled_epsilon, False)
-                    )
-                )
+                return (ep_idx, batch_indices[ep_idx - batch_start], scheduled_epsilon, False, merge_q)
+
+            # Chunked map amortises the per-task IPC; results come back in submission order
+            chunksize = max(1, (batch_end - batch_start) // (4 * workers))
+            results = pool.map(
+                run_targeted_episode_worker,
+                map(episode_args, range(batch_start, batch_end)),
+                chunksize=chunksize,
+            )
 
-            for fut in as_completed(futures):
-                result = fut.result()
+            q_updates = 0
+            batch_new_states = []
+            for result in results:
                 if not result.get("success"):
                     error_msg = result.get("error", "Unknown error")
                     if "traceback" in result:
@@ -413,9 +654,10 @@ def train_100_percent(
                         print(f"[ERR] Episode {result.get('episode')} failed: {error_msg}")
                     continue
 
-                for st in result["states_visited"]:
-                    if isinstance(st, list) and len(st) == 6:
-                        unique_states.add(tuple(int(x) for x in st))
+                q_updates += result.get("stats", {}).get("q_updates", 0)
+                new_ids = set(array("I", result["states_visited"])).difference(unique_states)
+                unique_states |= new_ids
+                batch_new_states.extend(new_ids)
 
                 if merge_q:
                     for state, qvals in result["q_table"].items():
@@ -426,11 +668,31 @@ def train_100_percent(
             batch_elapsed = time.time() - batch_t0
             new_states = len(unique_states) - states_before
 
-            # Write metrics to CSV
+            # Re-target scenarios as soon as a missing bin in a targeted dimension (4, 5)
+            # gets covered; other dimensions don't change the generated scenarios
+            update_bin_counts(bin_counts, batch_new_states)
+            current_gaps = coverage_gaps_from_counts(bin_counts)
+            if not gaps["missing_bins"]:
+                # Fresh run: the scenarios explore untargeted; compare later batches to these gaps
+                gaps = current_gaps
+            elif any(current_gaps["missing_bins"].get(dim) != gaps["missing_bins"].get(dim) for dim in (4, 5)):
+                gaps = current_gaps
+                scenarios = generate_targeted_scenarios(gaps, num_scenarios=2000)
+                _SCENARIOS = scenarios
+                if executor_type == "process":
+                    # Process workers hold their own copy of the scenarios; restart them. Let
+                    # any checkpoint write finish first: forking while the writer thread holds
+                    # a lock (file, stdout) could deadlock the new workers
+                    if pending_checkpoint is not None:
+                        pending_checkpoint.result()
+                    pool.shutdown()
+                    pool = make_episode_pool(executor_type, workers, scenarios)
+                print(f"[RETARGET] Missing combinations estimated: {gaps['total_missing']:,}")
+
+            # Buffer metrics rows; they're written to the CSV at each checkpoint
             if csv_writer:
                 states_per_second = new_states / batch_elapsed if batch_elapsed > 0 else 0
-                q_updates = sum(result.get("stats", {}).get("q_updates", 0) for result in [fut.result() for fut in futures] if result.get("success"))
-                csv_writer.writerow([
+                metrics_rows.append([
                     batch_start, batch_end, new_states, batch_elapsed, ema_batch_time or 0,
                     states_per_second, len(unique_states), (len(unique_states) / TOTAL_STATE_THEORETICAL) * 100, q_updates
                 ])
@@ -464,13 +726,26 @@ def train_100_percent(
             if episode_count % 500 == 0:
                 checkpoint_file = os.path.join(CHECKPOINT_DIR, f"military_100p_checkpoint_ep{episode_count}.json")
                 agent.save_q_table(checkpoint_file)
-                save_unique_states(unique_states)
+                pending_checkpoint = checkpoint_writer.submit(
+                    save_unique_states, array("I", unique_states)
+                )
+                if csv_writer:
+                    csv_writer.writerows(metrics_rows)
+                    csv_file.flush()
+                    metrics_rows.clear()
                 print(f"💾 Checkpoint saved: {checkpoint_file}")
 
             # Check for completion
             if len(unique_states) >= TOTAL_STATE_THEORETICAL:
                 print("\n🎉 100% COVERAGE ACHIEVED!")
                 break
+    finally:
+        checkpoint_writer.shutdown(wait=True)
+        pool.shutdown()
+        # Write remaining metrics and close CSV, even if the run was interrupted
+        if csv_file:
+            csv_writer.writerows(metrics_rows)
+            csv_file.close()
 
     # Final results
     final_coverage = (len(unique_states) / TOTAL_STATE_THEORETICAL) * 100
@@ -496,10 +771,6 @@ def train_100_percent(
     agent.save_q_table(final_model)
     save_unique_states(unique_states)
 
-    # Close CSV
-    if csv_file:
-        csv_file.close()
-
     print(f"Final model saved: {final_model}")
     print(f"Unique states saved: {UNIQUE_STATES_FILE}")
     print(f"Metrics CSV saved: {METRICS_CSV}")
@@ -514,7 +785,7 @@ if __name__ == "__main__":
     parser.add_argument("--episodes", type=int, default=10000, help="Number of episodes to run")
     parser.add_argument("--workers", type=int, default=8, help="Number of workers (threads or processes)")
     parser.add_argument("--resume", action="store_true", default=True, help="Resume from existing states")
-    parser.add_argument("--executor", choices=["thread", "process"], default="thread", help="Executor type")
+    parser.add_argument("--executor", choices=["thread", "process", "inline"], default="process", help="Executor type (inline: run episodes in this process, for short episodes)")
     parser.add_argument("--merge-q", action="store_true", help="Enable merging Q-tables from workers (default: disabled for faster coverage)")
     parser.add_argument("--no-merge-q", action="store_true", help="Disable merging Q-tables (deprecated, use --merge-q instead)")
     parser.add_argument("--adaptive-batch", action="store_true", help="Enable adaptive batch sizing")
@@ -7,24 +7,50 @@ import time
 import random
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+# Imported once per worker process rather than on every episode
+from world.engine import WorldEngine
+from tribes.tribal_manager import TribalManager
+from rl_military_agent import MilitaryRLAgent
+from rl_military_interface import (
+    execute_military_action,
+    compute_military_reward
+)
+from technology_system import technology_manager
+
+MILITARY_ACTIONS = (
+    'aggressive_attack', 'defensive_posture', 'strategic_retreat',
+    'force_reinforcement', 'tech_investment', 'diplomatic_pressure',
+    'siege_preparation', 'peaceful_approach',
+)
+COMBAT_ACTIONS = frozenset({'aggressive_attack', 'siege_preparation'})
+
+# Each discretised state dimension lies in [-1, bins - 1] (np.digitize(...) - 1), so shifting
+# by one gives an injective mixed-radix id over bins + 1 values per dimension
+STATE_RADICES = (16, 13, 9, 9, 8, 9)
+STATE_ID_SPACE = 16 * 13 * 9 * 9 * 8 * 9
+
+def state_id(state_vector):
+    """Integer id of a discretised military state, for the per-episode visited bitset."""
+    sid = 0
+    for value, radix in zip(state_vector, STATE_RADICES):
+        sid = sid * radix + int(value) + 1
+    return sid
+
 def run_ultra_episode_aggressive(args):
-    """Run episode with aggressive exploration."""
-    from world.engine import WorldEngine
-    from tribes.tribal_manager import TribalManager
-    from rl_military_agent import MilitaryRLAgent
-    from rl_military_interface import (
-        execute_military_action,
-        compute_military_reward
-    )
+    """Run episode with aggressive exploration.
 
+    Runs in a worker process, so only the Q-table and plain stats are returned; the set of
+    visited states stays in the worker and is reported as a count.
+    """
     episode_num, seed_offset, diversity_level = args
 
     try:
-        # Ultra-fast scenario setup
-        world_seed = random.randint(0, 10000000) + seed_offset * 100000
+        # Ultra-fast scenario setup. Forked workers start with identical module generator
+        # state, so the world seed is drawn from a generator keyed on the episode instead.
+        world_seed = random.Random(episode_num).randint(0, 10000000) + seed_offset * 100000
         world = WorldEngine(seed=world_seed, disable_faction_saving=True)
         tribal_manager = TribalManager()
         world._tribal_manager = tribal_manager
@@ -45,58 +71,73 @@ def run_ultra_episode_aggressive(args):
             'combats_initiated': 0,
             'successful_combats': 0,
             'total_reward': 0.0,
-            'states_visited': set(),
+            'states_visited': 0,
             'q_updates': 0,
         }
+        # One bit per possible state id, plus a running count of bits set
+        visited = bytearray(STATE_ID_SPACE >> 3)
+        states_visited = 0
+
+        # Actor/target draws come from an episode-local generator (derived from the seeded global
+        # one); it and the per-decision methods are bound once
+        decision_rng = random.Random(random.getrandbits(32))
+        randint, randrange, sample = decision_rng.randint, decision_rng.randrange, decision_rng.sample
+        world_tick = world.world_tick
+        live_tribes = tribal_manager.tribes
+        get_state = agent.get_military_state
+        choose_action = agent.choose_action
+        update_q_table = agent.update_q_table
 
         # Extended episode length for more learning
         for tick in range(0, 300, 4):  # More frequent decisions
-            world.world_tick()
+            world_tick()
 
-            active_tribes = list(tribal_manager.tribes.values())
-            if len(active_tribes) < 2:
+            active_tribes = list(live_tribes.values())
+            num_active = len(active_tribes)
+            if num_active < 2:
                 continue
 
             # Multiple aggressive decisions per tick
-            num_decisions = random.randint(3, 8)  # More decisions
+            num_decisions = randint(3, 8)  # More decisions
             for _ in range(num_decisions):
-                actor_tribe = random.choice(active_tribes)
-                target_tribes = [t for t in active_tribes if t != actor_tribe]
-
-                if not target_tribes:
-                    continue
+                actor_idx = randrange(num_active)
+                actor_tribe = active_tribes[actor_idx]
+                # Everyone but the actor, by position rather than comparing each tribe to it
+                target_tribes = active_tribes[:actor_idx] + active_tribes[actor_idx + 1:]
 
                 # Target multiple tribes for more conflicts
-                num_targets = min(len(target_tribes), random.randint(2, 6))
-                selected_targets = random.sample(target_tribes, num_targets)
+                num_targets = min(num_active - 1, randint(2, 6))
+                selected_targets = sample(target_tribes, num_targets)
 
-                state_vector = agent.get_military_state(actor_tribe, selected_targets, world)
+                state_vector = get_state(actor_tribe, selected_targets, world)
                 if state_vector is None:
                     continue
 
-                action_idx = agent.choose_action(state_vector)
-                actions = ['aggressive_attack', 'defensive_posture', 'strategic_retreat',
-                          'force_reinforcement', 'tech_investment', 'diplomatic_pressure',
-                          'siege_preparation', 'peaceful_approach']
-                action_name = actions[action_idx]
+                action_idx = choose_action(state_vector)
+                action_name = MILITARY_ACTIONS[action_idx]
 
                 action_results = execute_military_action(action_name, actor_tribe, selected_targets, tribal_manager, world)
 
-                if action_name in ['aggressive_attack', 'siege_preparation']:
+                if action_name in COMBAT_ACTIONS:
                     episode_stats['combats_initiated'] += 1
                     if action_results.get("success", False):
                         episode_stats['successful_combats'] += 1
 
-                next_state_vector = agent.get_military_state(actor_tribe, selected_targets, world)
+                next_state_vector = get_state(actor_tribe, selected_targets, world)
                 reward = compute_military_reward(action_results, state_vector, next_state_vector)
 
                 if next_state_vector is not None:
-                    agent.update_q_table(state_vector, action_idx, reward, next_state_vector)
+                    update_q_table(state_vector, action_idx, reward, next_state_vector)
                     episode_stats['q_updates'] += 1
 
                 episode_stats['total_reward'] += reward
-                episode_stats['states_visited'].add(tuple(state_vector) if isinstance(state_vector, list) else state_vector)
+                sid = state_id(state_vector)
+                mask = 1 << (sid & 7)
+                if not visited[sid >> 3] & mask:
+                    visited[sid >> 3] |= mask
+                    states_visited += 1
 
+        episode_stats['states_visited'] = states_visited
         return {
             'episode': episode_num,
             'stats': episode_stats,
@@ -111,10 +152,26 @@ def run_ultra_episode_aggressive(args):
             'success': False
         }
 
+def merge_q_table(target, source):
+    """Merge ``source`` Q-rows into ``target``: unseen states are adopted as-is (callers pass
+    rows nobody else holds), known ones averaged element-wise."""
+    for state, actions in source.items():
+        existing = target.get(state)
+        if existing is None:
+            target[state] = actions
+        else:
+            target[state] = [(a + b) / 2 for a, b in zip(existing, actions)]
+
+def run_episode_chunk(chunk_args):
+    """Run several episodes in one worker task.
+
+    Returns the per-episode results, each with its own Q-table, so the trainer still merges
+    every episode into the master table in turn.
+    """
+    return [run_ultra_episode_aggressive(args) for args in chunk_args]
+
 def create_ultra_diverse_tribe(tribal_manager, world, episode_num, tribe_idx, seed_offset, diversity_level=1.0):
     """Create tribe with maximum diversity."""
-    from technology_system import technology_manager
-
     random.seed(seed_offset + episode_num * 1000 + tribe_idx * 100)
 
     tribe_types = [
@@ -158,8 +215,11 @@ def create_ultra_diverse_tribe(tribal_manager, world, episode_num, tribe_idx, se
     world.factions[base_name] = faction
     return base_name, faction.population, faction.resources
 
-def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interval=2000):
-    """Run aggressive training for faster learning."""
+def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interval=2000, chunk_size=25):
+    """Run aggressive training for faster learning.
+
+    One worker pool serves the whole run; each task runs ``chunk_size`` episodes.
+    """
     print("🚀 Starting AGGRESSIVE Military RL Training")
     print(f"Target Episodes: {num_episodes} | Workers: {num_workers}")
     print("Goal: Accelerated learning towards 10-20% state coverage")
@@ -170,7 +230,6 @@ def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interv
     # Try to resume
     master_agent, start_episode, total_states_learned = load_checkpoint()
     if master_agent is None:
-        from rl_military_agent import MilitaryRLAgent
         master_agent = MilitaryRLAgent(epsilon=0.4, lr=0.2, gamma=0.95)
         start_episode = 0
         total_states_learned = 0
@@ -179,40 +238,31 @@ def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interv
     batch_size = 1000  # Smaller batches for more frequent updates
     successful_episodes = []
 
-    for batch_start in range(start_episode, num_episodes, batch_size):
-        batch_end = min(batch_start + batch_size, num_episodes)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for batch_start in range(start_episode, num_episodes, batch_size):
+            batch_end = min(batch_start + batch_size, num_episodes)
 
-        print(f"\n⚡ Processing Episodes {batch_start+1}-{batch_end} (Aggressive Mode)")
+            print(f"\n⚡ Processing Episodes {batch_start+1}-{batch_end} (Aggressive Mode)")
 
-        # Submit aggressive episodes
-        futures = []
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            for ep in range(batch_start, batch_end):
-                seed_offset = ep // 1000
-                diversity_level = min(2.0, 1.0 + ep / 10000)
-                future = executor.submit(run_ultra_episode_aggressive, (ep, seed_offset, diversity_level))
-                futures.append(future)
+            # Submit aggressive episodes, chunk_size per task
+            futures = []
+            for chunk_start in range(batch_start, batch_end, chunk_size):
+                chunk_args = [
+                    (ep, ep // 1000, min(2.0, 1.0 + ep / 10000))  # seed_offset, diversity_level
+                    for ep in range(chunk_start, min(chunk_start + chunk_size, batch_end))
+                ]
+                futures.append(executor.submit(run_episode_chunk, chunk_args))
 
             # Process results
             for future in as_completed(futures):
-                result = future.result()
-                if result['success']:
+                for result in future.result():
+                    if not result['success']:
+                        continue
+                    merge_q_table(master_agent.q_table, result.pop('q_table'))
                     successful_episodes.append(result)
-                    # Merge Q-table
-                    for state, actions in result['q_table'].items():
-                        if state not in master_agent.q_table:
-                            master_agent.q_table[state] = actions.copy()
-                        else:
-                            for action_idx, q_value in actions.items():
-                                if action_idx not in master_agent.q_table[state]:
-                                    master_agent.q_table[state][action_idx] = q_value
-                                else:
-                                    master_agent.q_table[state][action_idx] = (
-                                        master_agent.q_table[state][action_idx] + q_value
-                                    ) / 2
 
                     # Count new states
-                    new_states = len(result['stats']['states_visited'])
+                    new_states = result['stats']['states_visited']
                     total_states_learned += new_states
 
                     if len(successful_episodes) % 50 == 0:
@@ -220,9 +270,9 @@ def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interv
                         print(f"  Episode {result['episode']:5d} | New States: {new_states:2d} | "
                               f"Total: {total_states_learned:5d} | Coverage: {coverage:5.2f}%")
 
-        # Save checkpoint
-        if (batch_end - start_episode) % checkpoint_interval == 0:
-            save_checkpoint(master_agent, batch_end, total_states_learned, start_time)
+            # Save checkpoint
+            if (batch_end - start_episode) % checkpoint_interval == 0:
+                save_checkpoint(master_agent, batch_end, total_states_learned, start_time)
 
     # Final save
     final_path = "artifacts/models/military_qtable_aggressive_final.json"
@@ -243,8 +293,6 @@ def run_aggressive_training(num_episodes=50000, num_workers=8, checkpoint_interv
 
 def load_checkpoint(checkpoint_dir="artifacts/checkpoints"):
     """Load latest checkpoint with actual learning progress."""
-    from rl_military_agent import MilitaryRLAgent
-
     if not os.path.exists(checkpoint_dir):
         return None, 0, 0
 
@@ -301,8 +349,9 @@ def save_checkpoint(master_agent, episode_num, total_states, start_time, checkpo
     with open(f'{checkpoint_dir}/checkpoint_metadata_ep{episode_num}.json', 'w') as f:
         json.dump(metadata, f, indent=2)
 
-    # Save model
-    master_agent.save_q_table(f'{checkpoint_dir}/military_qtable_checkpoint_ep{episode_num}.json')
+    # Save model as compact JSON: same file and format analyze_qtable.py, the resume scripts
+    # and check_training_progress.py read, without the indentation bloat
+    master_agent.save_q_table(f'{checkpoint_dir}/military_qtable_checkpoint_ep{episode_num}.json', indent=None)
 
     coverage = (total_states / 645120) * 100
     print(f"Checkpoint saved: Episode {episode_num}, {total_states} states ({coverage:.4f}%)")
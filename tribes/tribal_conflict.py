@@ -1,10 +1,22 @@
 import random
-import math
 import logging
 from typing import Dict, List, Tuple, Set, Optional
 from .tribe import Tribe
 
 
+# Offsets of the eight tiles surrounding a tile
+_NEIGHBOR_OFFSETS = (
+    (1, 0),
+    (-1, 0),
+    (0, 1),
+    (0, -1),
+    (1, 1),
+    (1, -1),
+    (-1, 1),
+    (-1, -1),
+)
+
+
 class TribalTerritory:
     """Manages tribal territory claims and boundaries"""
 
@@ -24,7 +36,7 @@ class TribalTerritory:
             self.resource_zones[location] = resource_type
 
         # Update border tiles
-        self._update_borders()
+        self._update_borders_around((location,))
 
     def release_tile(self, location: Tuple[int, int]):
         """Release a claimed tile"""
@@ -36,30 +48,37 @@ class TribalTerritory:
                 self.marked_boundaries.remove(location)
 
             # Update border tiles
-            self._update_borders()
-
-    def _update_borders(self):
-        """Update which tiles are on the border"""
-        self.border_tiles.clear()
-
-        for tile in self.claimed_tiles:
-            x, y = tile
-            # Check adjacent tiles
-            adjacent = [
-                (x + 1, y),
-                (x - 1, y),
-                (x, y + 1),
-                (x, y - 1),
-                (x + 1, y + 1),
-                (x + 1, y - 1),
-                (x - 1, y + 1),
-                (x - 1, y - 1),
-            ]
-
-            for adj in adjacent:
-                if adj not in self.claimed_tiles:
-                    self.border_tiles.add(tile)
-                    break
+            self._update_borders_around((location,))
+
+    def _is_border(self, tile: Tuple[int, int]) -> bool:
+        """Check whether a claimed tile touches any unclaimed tile"""
+        x, y = tile
+        claimed = self.claimed_tiles
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            if (x + dx, y + dy) not in claimed:
+                return True
+        return False
+
+    def _update_borders_around(self, changed_tiles):
+        """Refresh border status for changed tiles and their neighbours only.
+
+        Claiming or releasing a tile can only change the border status of that
+        tile and the eight tiles around it, so there is no need to rescan the
+        whole territory.
+        """
+        claimed = self.claimed_tiles
+        border = self.border_tiles
+        affected = set()
+        for x, y in changed_tiles:
+            affected.add((x, y))
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                affected.add((x + dx, y + dy))
+
+        for tile in affected:
+            if tile in claimed and self._is_border(tile):
+                border.add(tile)
+            else:
+                border.discard(tile)
 
     def get_territory_size(self) -> int:
         """Get total territory size"""
@@ -95,6 +114,7 @@ class TribalTerritory:
     def expand_territory(self, center: Tuple[int, int], radius: int = 2):
         """Expand territory around a center point"""
         cx, cy = center
+        radius_sq = radius * radius
         new_claims = []
 
         for dx in range(-radius, radius + 1):
@@ -102,15 +122,19 @@ class TribalTerritory:
                 if dx == 0 and dy == 0:  # Skip center
                     continue
 
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance <= radius:
+                if dx * dx + dy * dy <= radius_sq:
                     tile = (cx + dx, cy + dy)
                     if tile not in self.claimed_tiles:
                         new_claims.append(tile)
 
         # Claim new tiles (limit expansion to prevent infinite growth)
-        for tile in new_claims[:5]:  # Limit to 5 new tiles per expansion
-            self.claim_tile(tile)
+        new_claims = new_claims[:5]  # Limit to 5 new tiles per expansion
+        for tile in new_claims:
+            self.claimed_tiles.add(tile)
+            self.tribe.claim_territory(tile)
+
+        # Refresh borders once for the whole batch
+        self._update_borders_around(new_claims)
 
 
 class TribalConflict:
@@ -6,6 +6,40 @@ from enum import Enum
 from .tribe import Tribe
 
 
+# Seasonal diplomatic behavior modifiers, keyed by season (0=Spring, 1=Summer,
+# 2=Autumn, 3=Winter); a dict so equal non-int seasons such as 3.0 still match
+_SEASONAL_MODIFIERS = {
+    # Spring
+    0: {
+        "trade_likelihood": 1.2,  # Good trade opportunities
+        "conflict_likelihood": 1.1,  # Territorial disputes
+        "alliance_likelihood": 1.2,  # New alliances for expansion
+        "expansion_likelihood": 1.4,  # High expansion season
+    },
+    # Summer
+    1: {
+        "trade_likelihood": 1.3,  # Peak trade season
+        "conflict_likelihood": 1.0,  # Normal conflict levels
+        "alliance_likelihood": 1.0,  # Normal alliance formation
+        "expansion_likelihood": 1.2,  # Good expansion opportunities
+    },
+    # Autumn
+    2: {
+        "trade_likelihood": 1.4,  # High trade for winter preparation
+        "conflict_likelihood": 0.8,  # Some conflicts over resources
+        "alliance_likelihood": 1.1,  # Form alliances for trade
+        "expansion_likelihood": 0.7,  # Limited expansion
+    },
+    # Winter
+    3: {
+        "trade_likelihood": 0.6,  # Reduced trade in winter
+        "conflict_likelihood": 0.4,  # Avoid conflicts in harsh season
+        "alliance_likelihood": 1.3,  # Alliances more valuable
+        "expansion_likelihood": 0.3,  # Limited expansion in winter
+    },
+}
+
+
 class DiplomaticEvent(Enum):
     """Types of diplomatic events that can trigger"""
 
@@ -102,36 +136,8 @@ class TribalDiplomacy:
                     "alliance_likelihood": 1.0,
                 }
             season = self.seasonal_context["season"]
-        # 0=Spring, 1=Summer, 2=Autumn, 3=Winter
-
-        if season == 3:  # Winter
-            return {
-                "trade_likelihood": 0.6,  # Reduced trade in winter
-                "conflict_likelihood": 0.4,  # Avoid conflicts in harsh season
-                "alliance_likelihood": 1.3,  # Alliances more valuable
-                "expansion_likelihood": 0.3,  # Limited expansion in winter
-            }
-        elif season == 2:  # Autumn
-            return {
-                "trade_likelihood": 1.4,  # High trade for winter preparation
-                "conflict_likelihood": 0.8,  # Some conflicts over resources
-                "alliance_likelihood": 1.1,  # Form alliances for trade
-                "expansion_likelihood": 0.7,  # Limited expansion
-            }
-        elif season == 0:  # Spring
-            return {
-                "trade_likelihood": 1.2,  # Good trade opportunities
-                "conflict_likelihood": 1.1,  # Territorial disputes
-                "alliance_likelihood": 1.2,  # New alliances for expansion
-                "expansion_likelihood": 1.4,  # High expansion season
-            }
-        else:  # Summer (season == 1)
-            return {
-                "trade_likelihood": 1.3,  # Peak trade season
-                "conflict_likelihood": 1.0,  # Normal conflict levels
-                "alliance_likelihood": 1.0,  # Normal alliance formation
-                "expansion_likelihood": 1.2,  # Good expansion opportunities
-            }
+        # 0=Spring, 1=Summer, 2=Autumn, 3=Winter; anything else is treated as Summer
+        return dict(_SEASONAL_MODIFIERS.get(season, _SEASONAL_MODIFIERS[1]))
 
     def _initialize_diplomacy(self):
         """Initialize diplomatic relations between all tribe pairs"""
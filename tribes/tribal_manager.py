@@ -3,6 +3,7 @@ import logging
 import json
 import os
 import gzip
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set, Any
 from .tribe import Tribe, TribalRole
@@ -453,7 +454,14 @@ class TribalManager:
             f"Processed {total_contributions} role contributions across {len(self.tribes)} tribes"
         )
 
-    def process_tribal_dynamics(self, world=None) -> None:
+    def process_tribal_dynamics(self, world=None) -> Dict[str, Any]:
+        """Advance cultural, event and diplomatic dynamics for all tribes.
+
+        Returns a summary of the latest activity so callers can report it without
+        re-walking the politics and diplomacy state:
+        ``{"political_events": {tribe_name: latest_event_or_None},
+        "diplomatic_event": latest_diplomatic_history_entry_or_None}``.
+        """
         # === Cultural Value Influence (pre-pass) ===
         # Adjust diplomacy bias based on top cultural values before other processing
         for tribe_name, tribe in self.tribes.items():
@@ -996,6 +1004,15 @@ class TribalManager:
                 if current_day % 35 == 0:
                     self._cultural_borrowing(current_day)
 
+        history = self.tribal_diplomacy.diplomatic_history
+        return {
+            "political_events": {
+                name: politics.political_events[-1] if politics.political_events else None
+                for name, politics in self.politics.items()
+            },
+            "diplomatic_event": history[-1] if history else None,
+        }
+
     def _form_pidgins(self, current_day: int = 0):
         """Form pidgin lexicons for high-interaction, low-similarity allied tribe pairs.
 
@@ -1953,14 +1970,22 @@ class TribalManager:
                         f"Tribe {tribe_name} migrated to seasonal camp at {new_location} for {current_season}"
                     )
 
-    def _process_seasonal_activities(self, tribe, season, season_name):
-        """Process season-specific tribal activities"""
+    def _process_seasonal_activities(
+        self, tribe, season, season_name, rng: Optional[random.Random] = None
+    ):
+        """Process season-specific tribal activities
+
+        ``rng`` lets callers supply their own ``random.Random`` instance; the
+        module-level random state is used when it is omitted.
+        """
+        if rng is None:
+            rng = random  # module functions draw from the shared global state
 
         # ===== WINTER ACTIVITIES =====
         if season == 3:  # Winter
             # Focus on survival, shelter building, storytelling
-            if random.random() < 0.15:  # 15% chance
-                activity_type = random.choice(
+            if rng.random() < 0.15:  # 15% chance
+                activity_type = rng.choice(
                     [
                         "shelter_reinforcement",
                         "storytelling_session",
@@ -1994,13 +2019,13 @@ class TribalManager:
         # ===== AUTUMN ACTIVITIES =====
         elif season == 2:  # Autumn
             # Focus on preparation, food storage, gathering
-            if random.random() < 0.20:  # 20% chance - high activity in preparation season
-                activity_type = random.choice(
+            if rng.random() < 0.20:  # 20% chance - high activity in preparation season
+                activity_type = rng.choice(
                     ["harvest_gathering", "food_preservation", "winter_preparation"]
                 )
                 if activity_type == "harvest_gathering":
                     # Bonus resource gathering
-                    bonus_food = random.randint(5, 15)
+                    bonus_food = rng.randint(5, 15)
                     tribe.add_shared_resource("food", bonus_food)
                     tribe.add_tribal_memory(
                         "seasonal_activity",
@@ -2026,8 +2051,8 @@ class TribalManager:
         # ===== SPRING ACTIVITIES =====
         elif season == 0:  # Spring
             # Focus on expansion, exploration, renewal
-            if random.random() < 0.18:  # 18% chance
-                activity_type = random.choice(
+            if rng.random() < 0.18:  # 18% chance
+                activity_type = rng.choice(
                     ["territory_scouting", "renewal_ceremony", "expansion_planning"]
                 )
                 if activity_type == "territory_scouting":
@@ -2052,8 +2077,8 @@ class TribalManager:
         # ===== SUMMER ACTIVITIES =====
         elif season == 1:  # Summer
             # Focus on peak activity, trade, social events
-            if random.random() < 0.12:  # 12% chance
-                activity_type = random.choice(
+            if rng.random() < 0.12:  # 12% chance
+                activity_type = rng.choice(
                     ["trading_expedition", "summer_festival", "peak_gathering"]
                 )
                 if activity_type == "trading_expedition":
@@ -2076,36 +2101,38 @@ class TribalManager:
                     )
                     self.logger.info(f"Tribe {tribe.name} held summer abundance festival")
 
-    def _get_seasonal_ceremony_types(self, season):
-        """Get ceremony types appropriate for the current season"""
-        base_ceremonies = ["hunting", "healing", "initiation", "thanksgiving"]
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_seasonal_ceremony_types(season) -> Tuple[str, ...]:
+        """Get ceremony types appropriate for the current season
 
+        Depends only on ``season``, so results are cached; a tuple is returned
+        so the cached value can be shared safely.
+        """
         if season == 3:  # Winter
-            return [
+            return (
                 "healing",
                 "thanksgiving",
                 "protection",
-            ]  # Focus on survival and gratitude
+            )  # Focus on survival and gratitude
         elif season == 2:  # Autumn
-            return [
+            return (
                 "thanksgiving",
                 "harvest",
                 "preparation",
-            ]  # Focus on gratitude and preparation
+            )  # Focus on gratitude and preparation
         elif season == 0:  # Spring
-            return [
+            return (
                 "initiation",
                 "renewal",
                 "hunting",
-            ]  # Focus on new beginnings and growth
+            )  # Focus on new beginnings and growth
         else:  # Summer
-            return [
+            return (
                 "hunting",
                 "celebration",
                 "abundance",
-            ]  # Focus on peak activity and celebration
-
-        return base_ceremonies
+            )  # Focus on peak activity and celebration
 
     def process_resource_competition(self):
         """Process resource competition between tribes"""
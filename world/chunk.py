@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from typing import List, Tuple, Any, Dict
 
@@ -5,8 +6,22 @@ from .terrain import TerrainType
 from npcs.npc import NPC
 
 
-@dataclass
-class Chunk:
+class _ChunkRuntimeSlots:
+    """Slots for chunk attributes assigned after construction (id, weather/event state).
+
+    Weather and event entries stay unset until first assignment, so ``getattr`` defaults
+    and ``hasattr`` checks on them keep working.
+    """
+
+    __slots__ = ("id", "weather", "impassable", "_weather_counter")
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a per-instance dict
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Chunk(_ChunkRuntimeSlots):
     """Represents a single chunk of the world.
 
     Resource Model (introduced Step C - depletion):
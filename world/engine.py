@@ -1,7 +1,8 @@
-from typing import Dict, Tuple, List, Any
+from typing import Dict, Tuple, List, Any, NamedTuple, Optional
 import logging
 from concurrent.futures import ThreadPoolExecutor
 import json
+import math
 import os
 import random
 import time
@@ -45,6 +46,16 @@ except ImportError:
         return f"NPC{random.randint(1000, 9999)}"
 
 
+class TickSample(NamedTuple):
+    """One audit sample recorded by WorldEngine.run_ticks."""
+
+    tick: int
+    population: int
+    food: float
+    births: int
+    deaths: int
+
+
 class WorldEngine:
     # === Food diagnostics instrumentation ===
     def food_diagnostics(self, window: int = 600) -> dict:
@@ -383,8 +394,6 @@ class WorldEngine:
         if not self.wave_enabled:
             return 1.0
 
-        import math
-
         # Primary abundance cycle (longer period for major resource swings)
         primary_cycle = math.sin(2 * math.pi * self._tick_count / self.abundance_cycle_length)
 
@@ -407,8 +416,6 @@ class WorldEngine:
         if not self.wave_enabled:
             return 1.0
 
-        import math
-
         # Fertility cycles (different phase from resource cycles)
         fertility_wave = math.sin(
             2 * math.pi * self._tick_count / self.fertility_wave_length + math.pi / 3
@@ -420,7 +427,7 @@ class WorldEngine:
         multiplier = max(0.3, min(1.8, multiplier))
         # Low-pop fertility floor: prevent prolonged suppression when population is critically low
         try:
-            total_pop = sum(len(f.npc_ids) for f in self.factions.values())
+            total_pop = self.total_population()
             if total_pop < 150:
                 multiplier = max(multiplier, 0.85)
         except Exception:
@@ -432,8 +439,6 @@ class WorldEngine:
         if not self.wave_enabled:
             return 1.0
 
-        import math
-
         # Mortality cycles (inverse relationship with fertility, different phase)
         mortality_wave = math.sin(
             2 * math.pi * self._tick_count / self.mortality_wave_length + math.pi
@@ -455,9 +460,17 @@ class WorldEngine:
             "wave_enabled": self.wave_enabled,
         }
 
+    def total_population(self) -> int:
+        """Total NPC count across all factions (npc_ids are sets, so each len() is O(1))."""
+        return sum(len(f.npc_ids) for f in self.factions.values())
+
+    def total_food(self) -> float:
+        """Total stored food across all factions."""
+        return sum(f.resources.get("food", 0.0) for f in self.factions.values())
+
     def _record_population_metric(self):
         try:
-            total = sum(len(f.npc_ids) for f in self.factions.values())
+            total = self.total_population()
             self._pop_history.append((self._tick_count, total))
             if len(self._pop_history) > self._pop_history_limit:
                 self._pop_history.pop(0)
@@ -550,8 +563,6 @@ class WorldEngine:
             recent = [p for (t, p) in self._pop_history if self._tick_count - t <= window_ticks]
             if len(recent) < 50:
                 return
-            import math
-
             mean = sum(recent) / len(recent)
             var = sum((p - mean) ** 2 for p in recent) / max(1, len(recent) - 1)
             std = math.sqrt(var)
@@ -1104,6 +1115,43 @@ class WorldEngine:
             except Exception:
                 pass
 
+    def run_ticks(
+        self,
+        n: int,
+        audit_every: int = 0,
+        stop_below: Optional[int] = None,
+        samples: Optional[List[TickSample]] = None,
+    ) -> List[TickSample]:
+        """Run ``n`` world ticks in one call and return sampled audit counters.
+
+        Every ``audit_every`` ticks (and on the final tick) a TickSample of
+        ``tick``, ``population``, ``food``, ``births`` and ``deaths`` is recorded;
+        ``audit_every=0`` disables sampling. If ``stop_below`` is set, the run stops
+        after the first sample whose population falls below it. Samples are appended
+        to ``samples`` when given, so a caller keeps the ones taken before a tick raises.
+        """
+        if samples is None:
+            samples = []
+        tick_fn = self.world_tick
+        last = n - 1
+        for tick in range(n):
+            tick_fn()
+            if not audit_every or (tick % audit_every and tick != last):
+                continue
+            population = self.total_population()
+            samples.append(
+                TickSample(
+                    tick,
+                    population,
+                    self.total_food(),
+                    self._audit_births_tick,
+                    self._audit_starvation_deaths_tick + self._audit_natural_deaths_tick,
+                )
+            )
+            if stop_below is not None and population < stop_below:
+                break
+        return samples
+
     def world_tick(self):
         """Process one tick of world simulation.
 
@@ -1216,28 +1264,24 @@ class WorldEngine:
         # Precompute all_active_chunks only once in normal mode (fast mode won't use it)
         all_active_chunks_cache = None if (fast or ultrafast) else list(self.active_chunks.values())
 
+        # World time is fixed for the duration of NPC processing; build its context once
+        time_context = {
+            "hour": self.current_hour,
+            "day": self.current_day,
+            "season": self.current_season,
+            "season_name": self.season_names[self.current_season],
+            "total_minutes": self.total_minutes,
+            "is_day": self.is_daytime(),
+            "time_of_day": self.get_time_of_day(),
+            "day_cycle": self.current_hour / 24.0,
+        }
+
         def process_npc(npc, chunk, all_active_chunks_cache):
             npc_ctx_t0 = time.time() if profile else None
             if fast or ultrafast:
-                world_context = {
-                    "current_chunk": chunk,
-                    **(
-                        {
-                            "time": {
-                                "hour": self.current_hour,
-                                "day": self.current_day,
-                                "season": self.current_season,
-                                "season_name": self.season_names[self.current_season],
-                                "total_minutes": self.total_minutes,
-                                "is_day": self.is_daytime(),
-                                "time_of_day": self.get_time_of_day(),
-                                "day_cycle": self.current_hour / 24.0,
-                            }
-                        }
-                        if not ultrafast
-                        else {}
-                    ),
-                }
+                world_context = {"current_chunk": chunk}
+                if not ultrafast:
+                    world_context["time"] = time_context
                 faction_memory = {}
                 if npc.faction_id and npc.faction_id in self.factions:
                     faction_memory = self.factions[npc.faction_id].memory
@@ -1254,16 +1298,7 @@ class WorldEngine:
                     "nearby_chunks": nearby_chunks,
                     "all_chunks": all_active_chunks_cache,
                     "world_engine": self,
-                    "time": {
-                        "hour": self.current_hour,
-                        "day": self.current_day,
-                        "season": self.current_season,
-                        "season_name": self.season_names[self.current_season],
-                        "total_minutes": self.total_minutes,
-                        "is_day": self.is_daytime(),
-                        "time_of_day": self.get_time_of_day(),
-                        "day_cycle": self.current_hour / 24.0,
-                    },
+                    "time": time_context,
                 }
                 faction_memory = {}
                 if npc.faction_id and npc.faction_id in self.factions:
@@ -1789,7 +1824,7 @@ class WorldEngine:
         # === Balance Audit Aggregation ===
         try:
             # Aggregate faction resource totals
-            total_food = sum(f.resources.get("food", 0.0) for f in self.factions.values())
+            total_food = self.total_food()
             total_wood = sum(f.resources.get("Wood", 0.0) for f in self.factions.values())
             total_ore = sum(f.resources.get("Ore", 0.0) for f in self.factions.values())
             # Starvation pressure stats